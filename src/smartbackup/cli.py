@@ -387,6 +387,7 @@ def _handle_compress(
     backup_folder: str = "Documents-Backup",
 ) -> None:
     """Core logic for the compress subcommand."""
+    import os
     import shutil
 
     from smartbackup.core.compressor import SUPPORTED_FORMATS, BackupCompressor
@@ -417,7 +418,7 @@ def _handle_compress(
         raise typer.Exit(code=1)
 
     # Check if already compressed
-    compressor = BackupCompressor(logger)
+    compressor = BackupCompressor(logger, max_workers=min(8, (os.cpu_count() or 4)))
     if compressor.is_already_compressed(root, resolved_device):
         logger.warning(f"Archives already exist for device '{resolved_device}'")
         existing = compressor.find_archives(root, resolved_device)
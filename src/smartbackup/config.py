@@ -2,15 +2,21 @@
 Config - Configuration classes and constants for SmartBackup.
 """
 
+import copy
 import json
 import os
 import platform
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Set
+from typing import TYPE_CHECKING, FrozenSet, Optional, Tuple
+
+from smartbackup.models import DATACLASS_SLOTS
+
+if TYPE_CHECKING:
+    from smartbackup.core.scanner import ExclusionFilter
 
 # Default exclusions for developer projects
-DEFAULT_EXCLUSIONS: Set[str] = {
+DEFAULT_EXCLUSIONS: FrozenSet[str] = frozenset({
     # Node.js / JavaScript
     "node_modules",
     ".npm",
@@ -84,10 +90,10 @@ DEFAULT_EXCLUSIONS: Set[str] = {
     ".sass-cache",
     # Docker
     ".docker",
-}
+})
 
 # File extensions that should always be skipped
-EXCLUDED_EXTENSIONS: Set[str] = {
+EXCLUDED_EXTENSIONS: FrozenSet[str] = frozenset({
     ".pyc",
     ".pyo",
     ".pyd",  # Python compiled
@@ -101,19 +107,29 @@ EXCLUDED_EXTENSIONS: Set[str] = {
     ".log",
     ".tmp",
     ".temp",  # Temporary
-}
+})
+
+# Exclusion journals larger than this are folded into config.json on load
+EXCLUSION_JOURNAL_COMPACT_SIZE = 64 * 1024
 
+# (st_mtime_ns, st_size) of a file, or None when it does not exist
+FileKey = Optional[Tuple[int, int]]
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BackupConfig:
-    """Configuration for the backup system."""
+    """Configuration for the backup system.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive a modified
+    config. The exclusion sets default to the shared module-level frozensets.
+    """
 
     source_path: Path
     backup_path: Path
     backup_folder_name: str = "Documents-Backup"
     device_name: str = ""  # Device identifier for per-device subfolder
-    exclusions: Set[str] = field(default_factory=lambda: DEFAULT_EXCLUSIONS.copy())
-    excluded_extensions: Set[str] = field(default_factory=lambda: EXCLUDED_EXTENSIONS.copy())
+    exclusions: FrozenSet[str] = DEFAULT_EXCLUSIONS
+    excluded_extensions: FrozenSet[str] = EXCLUDED_EXTENSIONS
     max_workers: int = 4
     use_hash_verification: bool = False  # Enable SHA-256 hashing for change detection
     hash_all_files: bool = False  # Hash all files regardless of size (requires use_hash_verification)
@@ -125,6 +141,34 @@ class BackupConfig:
     manifest_format: str = "json"  # "json" or "sqlite" (future)
     # Compression options
     compress_format: Optional[str] = None  # None (no compression), "zip", or "tar.gz"
+    # Matcher behind is_excluded(), built on first use
+    _exclusion_filter: Optional["ExclusionFilter"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of names but store frozensets so membership tests
+        # hit the C fast path and instances stay hashable.
+        if not isinstance(self.exclusions, frozenset):
+            object.__setattr__(self, "exclusions", frozenset(self.exclusions))
+        if not isinstance(self.excluded_extensions, frozenset):
+            object.__setattr__(self, "excluded_extensions", frozenset(self.excluded_extensions))
+
+    def is_excluded(self, name: str) -> bool:
+        """
+        Checks a single file or folder name against this config's exclusions.
+
+        Only name-based rules are applied (exact names, wildcard patterns and
+        extensions); virtual environment detection needs the filesystem and
+        is left to ExclusionFilter.should_exclude().
+        """
+        exclusion_filter = self._exclusion_filter
+        if exclusion_filter is None:
+            from smartbackup.core.scanner import ExclusionFilter
+
+            exclusion_filter = ExclusionFilter(self.exclusions, self.excluded_extensions)
+            object.__setattr__(self, "_exclusion_filter", exclusion_filter)
+        return exclusion_filter.match_name(name)[0]
 
 
 class ConfigManager:
@@ -139,6 +183,9 @@ class ConfigManager:
     def __init__(self) -> None:
         self.config_dir = self._get_config_dir()
         self.config_file = self.config_dir / "config.json"
+        # ((path, config (mtime_ns, size), journal (mtime_ns, size)), data)
+        # of the last parsed config file and exclusions journal
+        self._cache: Optional[Tuple[Tuple[Path, FileKey, FileKey], dict]] = None
 
     def _get_config_dir(self) -> Path:
         """Determines the configuration directory."""
@@ -150,35 +197,119 @@ class ConfigManager:
         else:
             return Path.home() / ".config" / "smartbackup"
 
+    @property
+    def exclusions_journal(self) -> Path:
+        """Append-only log of exclusions added since the config was last saved."""
+        return self.config_file.with_name(self.config_file.stem + ".exclusions.jsonl")
+
+    @staticmethod
+    def _file_key(path: Path) -> FileKey:
+        """Stat a file for the load() cache key."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def load(self) -> dict:
-        """Loads the configuration."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        """
+        Loads the configuration.
+
+        Exclusions recorded in the journal by add_exclusion() are replayed on
+        top of config.json. The result is cached and only rebuilt when either
+        file's mtime or size changes, so repeated getters within one session
+        parse it once.
+        """
+        journal = self.exclusions_journal
+        config_key = self._file_key(self.config_file)
+        journal_key = self._file_key(journal)
+        if config_key is None and journal_key is None:
+            return {}
+
+        key = (self.config_file, config_key, journal_key)
+        if self._cache is None or self._cache[0] != key:
+            data: dict = {}
+            if config_key is not None:
+                try:
+                    with open(self.config_file, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except Exception:
+                    return {}
+
+            if journal_key is not None:
+                self._replay_journal(data, journal)
+                if journal_key[1] > EXCLUSION_JOURNAL_COMPACT_SIZE:
+                    try:
+                        # Fold the journal into config.json and start a new one
+                        self.save(data)
+                    except OSError:
+                        pass
+                    return copy.deepcopy(data)
+
+            self._cache = (key, data)
+
+        # Callers mutate the result before saving it back
+        return copy.deepcopy(self._cache[1])
+
+    @staticmethod
+    def _replay_journal(config: dict, journal: Path) -> None:
+        """Applies the exclusion journal's entries to a loaded config in place."""
+        exclusions = list(config.get("exclusions", []))
+        seen = set(exclusions)
+        try:
+            with open(journal, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Torn line from an interrupted add_exclusion()
+                        continue
+                    if not isinstance(entry, dict) or entry.get("op") != "add":
+                        continue
+                    pattern = entry.get("pattern")
+                    if isinstance(pattern, str) and pattern not in seen:
+                        seen.add(pattern)
+                        exclusions.append(pattern)
+        except OSError:
+            return
+        config["exclusions"] = exclusions
 
     def save(self, config: dict) -> None:
-        """Saves the configuration."""
+        """
+        Saves the configuration.
+
+        Uses atomic write pattern: write to temp file, then rename. The saved
+        config supersedes the exclusions journal, which is removed.
+        """
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, default=str)
+        temp_path = self.config_file.with_suffix(".json.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(config, f, indent=2, default=str)
+            os.replace(temp_path, self.config_file)
+            self.exclusions_journal.unlink(missing_ok=True)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            self._cache = None
 
-    def get_exclusions(self) -> Set[str]:
+    def get_exclusions(self) -> FrozenSet[str]:
         """Loads custom exclusions."""
         config = self.load()
         custom = set(config.get("exclusions", []))
         return DEFAULT_EXCLUSIONS | custom
 
     def add_exclusion(self, pattern: str) -> None:
-        """Adds an exclusion."""
-        config = self.load()
-        exclusions = set(config.get("exclusions", []))
-        exclusions.add(pattern)
-        config["exclusions"] = list(exclusions)
-        self.save(config)
+        """
+        Adds an exclusion.
+
+        Appends one line to the exclusions journal instead of rewriting
+        config.json; load() replays it.
+        """
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.exclusions_journal, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "add", "pattern": pattern}) + "\n")
 
     def set_preferred_target(self, label: str) -> None:
         """Saves preferred target medium."""
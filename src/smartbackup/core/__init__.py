@@ -3,6 +3,7 @@
 from smartbackup.core.compressor import BackupCompressor
 from smartbackup.core.scanner import FileScanner, ExclusionFilter
 from smartbackup.core.detector import ChangeDetector
+from smartbackup.core.hashcache import HashCache
 from smartbackup.core.engine import BackupEngine, DryRunBackupEngine
 from smartbackup.core.restore import RestoreEngine, RestoreResult, ConflictResolution
 
@@ -11,6 +12,7 @@ __all__ = [
     "FileScanner",
     "ExclusionFilter",
     "ChangeDetector",
+    "HashCache",
     "BackupEngine",
     "DryRunBackupEngine",
     "RestoreEngine",
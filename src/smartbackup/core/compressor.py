@@ -4,18 +4,232 @@ BackupCompressor - Handles compression of backup directories into archives.
 Supports zip and tar.gz formats using Python stdlib (zipfile, tarfile).
 """
 
+import os
+import struct
 import tarfile
 import tempfile
+import time
 import zipfile
-from datetime import datetime
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Callable, Deque, Iterator, List, Optional, Tuple
 
 from smartbackup.ui.logger import BackupLogger
 
 # Supported compression formats
 SUPPORTED_FORMATS = ("zip", "tar.gz")
 
+# Files smaller than this are stored uncompressed in zip archives; deflate's
+# block and Huffman table overhead outweighs any savings on tiny payloads.
+ZIP_STORE_THRESHOLD = 512
+
+# Deflate level used for zip members
+ZIP_COMPRESS_LEVEL = 6
+
+# In the parallel zip writer, files at or above this size are deflated in a
+# streaming loop on the writing thread instead of being buffered in a worker.
+ZIP_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# Read size for deflated zip members; small enough that each chunk is still
+# in cache when zlib reads it after the CRC pass
+ZIP_CHUNK_SIZE = 256 * 1024
+
+# (source file or None for a directory entry, member metadata)
+ZipEntry = Tuple[Optional[Path], zipfile.ZipInfo]
+
+# Zip record layouts (PKWARE APPNOTE 4.3.7, 4.3.12, 4.3.16), compiled once
+_LOCAL_HEADER = struct.Struct("<I2B4H3I2H")
+_CENTRAL_RECORD = struct.Struct("<I4B4H3I5H2I")
+_END_RECORD = struct.Struct("<I4H2IH")
+_CRC_AND_SIZES = struct.Struct("<3I")
+_LOCAL_HEADER_MAGIC = 0x04034B50
+_CENTRAL_RECORD_MAGIC = 0x02014B50
+_END_RECORD_MAGIC = 0x06054B50
+
+
+def _walk_sorted(directory: str, prefix: str = "") -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (entry, arcname) for everything below directory, in sorted order.
+
+    The order matches sorted(Path(directory).rglob("*")): each folder comes
+    right before its own contents. Arcnames are built while descending, and
+    file/folder checks come from the directory listing, so the walk itself
+    costs no extra stat() calls. Like rglob(), symlinked folders are listed
+    but not descended into and unreadable folders are skipped.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+    except PermissionError:
+        return
+    for entry in entries:
+        arcname = prefix + entry.name
+        yield entry, arcname
+        if entry.is_dir() and not entry.is_symlink():
+            yield from _walk_sorted(entry.path, arcname + "/")
+
+
+def _zipinfo_from_stat(arcname: str, st: os.stat_result, is_dir: bool) -> zipfile.ZipInfo:
+    """Build member metadata from an existing stat result, like ZipInfo.from_file()."""
+    if is_dir:
+        arcname += "/"
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[0:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    if is_dir:
+        zinfo.file_size = 0
+        zinfo.external_attr |= 0x10  # MS-DOS directory flag
+    else:
+        zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """Pass a page-cache hint for the whole file, where posix_fadvise exists."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        # Purely advisory; some filesystems reject it
+        pass
+
+
+def _deflate_bound(size: int) -> int:
+    """Worst-case raw deflate output size for size input bytes (zlib's compressBound)."""
+    return size + (size >> 12) + (size >> 14) + (size >> 25) + 13
+
+
+def _fits_without_zip64(entries: List[ZipEntry]) -> bool:
+    """Check whether an archive of these entries can skip zip64 records."""
+    if len(entries) >= zipfile.ZIP_FILECOUNT_LIMIT:
+        return False
+    total = 0
+    for _, zinfo in entries:
+        if zinfo.file_size >= zipfile.ZIP64_LIMIT:
+            return False
+        name_len = len(zinfo.filename.encode("utf-8"))
+        # Local header + central directory record + payload upper bound
+        total += 30 + 46 + 2 * name_len + _deflate_bound(zinfo.file_size)
+    return total < zipfile.ZIP64_LIMIT
+
+
+def _encode_name(zinfo: zipfile.ZipInfo) -> Tuple[bytes, int]:
+    """Encode a member name the way zipfile does, flagging UTF-8 when needed."""
+    try:
+        return zinfo.filename.encode("ascii"), zinfo.flag_bits
+    except UnicodeEncodeError:
+        return zinfo.filename.encode("utf-8"), zinfo.flag_bits | 0x800
+
+
+def _dos_datetime(zinfo: zipfile.ZipInfo) -> Tuple[int, int]:
+    """Pack a member's date_time into MS-DOS (time, date) fields."""
+    year, month, day, hour, minute, second = zinfo.date_time
+    dostime = (hour << 11) | (minute << 5) | (second // 2)
+    dosdate = ((year - 1980) << 9) | (month << 5) | day
+    return dostime, dosdate
+
+
+def _local_header(zinfo: zipfile.ZipInfo) -> bytes:
+    """Encode the local file header for a member."""
+    name, flags = _encode_name(zinfo)
+    dostime, dosdate = _dos_datetime(zinfo)
+    return _LOCAL_HEADER.pack(
+        _LOCAL_HEADER_MAGIC,
+        zinfo.extract_version,
+        zinfo.reserved,
+        flags,
+        zinfo.compress_type,
+        dostime,
+        dosdate,
+        zinfo.CRC,
+        zinfo.compress_size,
+        zinfo.file_size,
+        len(name),
+        0,
+    ) + name
+
+
+def _central_record(zinfo: zipfile.ZipInfo) -> bytes:
+    """Encode the central directory record for a member."""
+    name, flags = _encode_name(zinfo)
+    dostime, dosdate = _dos_datetime(zinfo)
+    return _CENTRAL_RECORD.pack(
+        _CENTRAL_RECORD_MAGIC,
+        zinfo.create_version,
+        zinfo.create_system,
+        zinfo.extract_version,
+        zinfo.reserved,
+        flags,
+        zinfo.compress_type,
+        dostime,
+        dosdate,
+        zinfo.CRC,
+        zinfo.compress_size,
+        zinfo.file_size,
+        len(name),
+        0,
+        0,
+        0,
+        0,
+        zinfo.external_attr,
+        zinfo.header_offset,
+    ) + name
+
+
+def _end_record(count: int, size: int, offset: int) -> bytes:
+    """Encode the end of central directory record."""
+    return _END_RECORD.pack(_END_RECORD_MAGIC, 0, 0, count, count, size, offset, 0)
+
+
+def _deflate_stream(src: BinaryIO, write: Callable[[bytes], object]) -> Tuple[int, int, int]:
+    """Raw-deflate src into write(), computing the CRC-32 in the same pass.
+
+    Each chunk is checksummed while it is still in cache, right before it is
+    handed to zlib, so the data is only read from memory once.
+
+    Returns:
+        Tuple (crc32, uncompressed_size, compressed_size)
+    """
+    crc = 0
+    file_size = 0
+    compress_size = 0
+    deflater = zlib.compressobj(ZIP_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    while True:
+        chunk = src.read(ZIP_CHUNK_SIZE)
+        if not chunk:
+            break
+        crc = zlib.crc32(chunk, crc)
+        file_size += len(chunk)
+        payload = deflater.compress(chunk)
+        if payload:
+            compress_size += len(payload)
+            write(payload)
+    payload = deflater.flush()
+    compress_size += len(payload)
+    write(payload)
+    return crc, file_size, compress_size
+
+
+def _deflate_file(path: Path, compress_type: int) -> Tuple[int, int, bytes]:
+    """Read and compress one zip member in a worker thread.
+
+    zlib releases the GIL while compressing, so several of these run in
+    parallel.
+
+    Returns:
+        Tuple (crc32, uncompressed_size, payload)
+    """
+    with open(path, "rb") as src:
+        _fadvise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+        if compress_type == zipfile.ZIP_DEFLATED:
+            parts: List[bytes] = []
+            crc, file_size, _ = _deflate_stream(src, parts.append)
+            return crc, file_size, b"".join(parts)
+        data = src.read()
+    return zlib.crc32(data), len(data), data
+
 
 class BackupCompressor:
     """Handles compression of backup directories into archives.
@@ -24,8 +238,10 @@ class BackupCompressor:
     formats. Uses atomic writes (temp file + rename) to prevent partial archives.
     """
 
-    def __init__(self, logger: BackupLogger):
+    def __init__(self, logger: BackupLogger, max_workers: int = 1):
         self.logger = logger
+        # Zip members are deflated on this many threads; 1 uses zipfile directly
+        self.max_workers = max_workers
 
     def compress(
         self,
@@ -74,8 +290,6 @@ class BackupCompressor:
 
         try:
             # Close the file descriptor; the compression libraries open by name
-            import os
-
             os.close(temp_fd)
 
             if fmt == "zip":
@@ -86,7 +300,11 @@ class BackupCompressor:
             # Atomic rename
             temp_path.replace(output_path)
 
-            archive_size = output_path.stat().st_size
+            with open(output_path, "rb") as archive:
+                archive_size = os.fstat(archive.fileno()).st_size
+                # The archive is not read back; drop its pages from the page
+                # cache rather than letting them evict hotter data.
+                _fadvise(archive.fileno(), "POSIX_FADV_DONTNEED")
             self.logger.success(
                 f"Archive created: {output_path.name} "
                 f"({archive_size / (1024 * 1024):.2f} MB)"
@@ -100,30 +318,128 @@ class BackupCompressor:
             raise
 
     def _compress_zip(self, source_dir: Path, archive_path: Path) -> None:
-        """Create a .zip archive using zipfile module."""
-        file_count = 0
-        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file_path in sorted(source_dir.rglob("*")):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(source_dir)
-                    zf.write(file_path, arcname)
-                    file_count += 1
-                elif file_path.is_dir():
-                    # Preserve empty directories by adding a directory entry.
-                    # ZipInfo trailing slash signals a directory to most tools.
-                    arcname = str(file_path.relative_to(source_dir)) + "/"
-                    zf.writestr(zipfile.ZipInfo(arcname), "")
+        """Create a .zip archive, deflating members in parallel when possible."""
+        entries = self._collect_zip_entries(source_dir)
+        file_count = sum(1 for path, _ in entries if path is not None)
+
+        if self.max_workers > 1 and _fits_without_zip64(entries):
+            self._write_zip_parallel(entries, archive_path)
+        else:
+            self._write_zip_serial(entries, archive_path)
 
         self.logger.info(f"Compressed {file_count} files into zip archive")
 
+    @staticmethod
+    def _collect_zip_entries(source_dir: Path) -> List[ZipEntry]:
+        """Walk source_dir in sorted order and build the zip member list."""
+        entries: List[ZipEntry] = []
+        for entry, arcname in _walk_sorted(os.fspath(source_dir)):
+            if entry.is_file():
+                zinfo = _zipinfo_from_stat(arcname, entry.stat(), is_dir=False)
+                if zinfo.file_size < ZIP_STORE_THRESHOLD:
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                entries.append((Path(entry.path), zinfo))
+            elif entry.is_dir():
+                # Preserve empty directories by adding a directory entry.
+                # ZipInfo trailing slash signals a directory to most tools.
+                entries.append((None, _zipinfo_from_stat(arcname, entry.stat(), is_dir=True)))
+        return entries
+
+    @staticmethod
+    def _write_zip_serial(entries: List[ZipEntry], archive_path: Path) -> None:
+        """Write the archive with zipfile on the calling thread."""
+        with zipfile.ZipFile(
+            archive_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL
+        ) as zf:
+            for file_path, zinfo in entries:
+                if file_path is None:
+                    zf.writestr(zinfo, "")
+                elif zinfo.compress_type == zipfile.ZIP_STORED:
+                    zf.writestr(zinfo, file_path.read_bytes())
+                else:
+                    zf.write(file_path, zinfo.filename)
+
+    def _write_zip_parallel(self, entries: List[ZipEntry], archive_path: Path) -> None:
+        """Write the archive by hand, deflating members on a thread pool.
+
+        Members are written in submission order, so the result is the same
+        archive zipfile would produce. At most 2 * max_workers members are
+        buffered at once; files of ZIP_STREAM_THRESHOLD bytes or more are
+        streamed on this thread instead.
+        """
+        written: List[zipfile.ZipInfo] = []
+        pending: Deque[Tuple[zipfile.ZipInfo, Future]] = deque()
+        window = 2 * self.max_workers
+
+        with open(archive_path, "wb") as out, ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+
+            def drain(limit: int) -> None:
+                while len(pending) > limit:
+                    zinfo, future = pending.popleft()
+                    zinfo.CRC, zinfo.file_size, payload = future.result()
+                    zinfo.compress_size = len(payload)
+                    zinfo.header_offset = out.tell()
+                    out.write(_local_header(zinfo))
+                    out.write(payload)
+                    written.append(zinfo)
+
+            for file_path, zinfo in entries:
+                if file_path is None:
+                    done: Future = Future()
+                    done.set_result((0, 0, b""))
+                    pending.append((zinfo, done))
+                elif zinfo.file_size >= ZIP_STREAM_THRESHOLD:
+                    drain(0)
+                    self._stream_zip_member(out, file_path, zinfo)
+                    written.append(zinfo)
+                else:
+                    future = executor.submit(_deflate_file, file_path, zinfo.compress_type)
+                    pending.append((zinfo, future))
+                drain(window)
+            drain(0)
+
+            central_offset = out.tell()
+            for zinfo in written:
+                out.write(_central_record(zinfo))
+            central_size = out.tell() - central_offset
+            if out.tell() >= zipfile.ZIP64_LIMIT:
+                # Only possible if files grew while being archived
+                raise zipfile.LargeZipFile("Archive exceeded the zip64 limit while writing")
+            out.write(_end_record(len(written), central_size, central_offset))
+
+    @staticmethod
+    def _stream_zip_member(out: BinaryIO, file_path: Path, zinfo: zipfile.ZipInfo) -> None:
+        """Deflate a large file straight into out, patching its header afterwards."""
+        # Placeholder CRC and sizes, patched once the member is written
+        zinfo.CRC = 0
+        zinfo.compress_size = 0
+        zinfo.header_offset = out.tell()
+        out.write(_local_header(zinfo))
+
+        with open(file_path, "rb") as src:
+            _fadvise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+            crc, file_size, compress_size = _deflate_stream(src, out.write)
+
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = compress_size
+        end = out.tell()
+        # CRC-32 and both sizes sit at offset 14 of the local header
+        out.seek(zinfo.header_offset + 14)
+        out.write(_CRC_AND_SIZES.pack(crc, compress_size, file_size))
+        out.seek(end)
+
     def _compress_tar_gz(self, source_dir: Path, archive_path: Path) -> None:
         """Create a .tar.gz archive using tarfile module."""
         file_count = 0
         with tarfile.open(archive_path, "w:gz") as tf:
-            for file_path in sorted(source_dir.rglob("*")):
-                arcname = str(file_path.relative_to(source_dir))
-                tf.add(file_path, arcname=arcname, recursive=False)
-                if file_path.is_file():
+            for entry, arcname in _walk_sorted(os.fspath(source_dir)):
+                tf.add(entry.path, arcname=arcname, recursive=False)
+                if entry.is_file():
                     file_count += 1
 
         self.logger.info(f"Compressed {file_count} files into tar.gz archive")
@@ -139,7 +455,11 @@ class BackupCompressor:
         Returns:
             Filename string like "MyDevice_20260228_093022.zip".
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        lt = time.localtime()
+        timestamp = (
+            f"{lt.tm_year:04d}{lt.tm_mon:02d}{lt.tm_mday:02d}_"
+            f"{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}"
+        )
         ext = fmt  # "zip" or "tar.gz"
         return f"{device_name}_{timestamp}.{ext}"
 
@@ -2,12 +2,80 @@
 ChangeDetector - Detects changes between source and target files.
 """
 
+import os
+import sqlite3
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from smartbackup.core.hashcache import HASH_CACHE_FILENAME, HashCache
+from smartbackup.hashing import hash_file
 from smartbackup.models import FileInfo
+from smartbackup.parallel import parallel_map, stat_workers_from_env
 from smartbackup.ui.logger import BackupLogger
 
+# Bytes compared at the start of two files before either is fully hashed
+HEAD_COMPARE_SIZE = 128 * 1024
+
+
+def _heads_differ(first: Path, second: Path) -> bool:
+    """Returns True if the first HEAD_COMPARE_SIZE bytes of the files differ."""
+    with open(first, "rb") as a, open(second, "rb") as b:
+        return a.read(HEAD_COMPARE_SIZE) != b.read(HEAD_COMPARE_SIZE)
+
+
+def _list_files(root: str) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yields (relative path, directory entry) for every file below root.
+
+    Walks with os.scandir() on an explicit stack, so file/folder checks come
+    from the directory listing. Like Path.rglob(), symlinked folders are not
+    followed and unreadable folders are skipped.
+    """
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    relative = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, relative + os.sep))
+                    elif entry.is_file():
+                        yield relative, entry
+        except PermissionError:
+            continue
+
+
+def _stat_entry(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """Stats a directory entry, returning None if it vanished or is unreadable."""
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _walk_files(root: str, stat_workers: int = 1) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yields (relative path, stat result) for every file below root.
+
+    Each file is stat'ed exactly once. On large trees the stats are spread
+    over stat_workers threads, since on network or spinning disks each one
+    is dominated by latency rather than CPU.
+    """
+    if stat_workers <= 1:
+        for relative, entry in _list_files(root):
+            stat = _stat_entry(entry)
+            if stat is not None:
+                yield relative, stat
+        return
+
+    files = list(_list_files(root))
+    stats = parallel_map(_stat_entry, [entry for _, entry in files], stat_workers)
+
+    for (relative, _), stat in zip(files, stats):
+        if stat is not None:
+            yield relative, stat
+
 
 class ChangeDetector:
     """
@@ -17,20 +85,46 @@ class ChangeDetector:
     - Size comparison (fast)
     - Timestamp comparison (fast)
     - Hash comparison (accurate, optional)
+
+    With use_hash, backup files whose size and mtime match the source are
+    hashed and compared to the source hash. Their digests are kept in a
+    HashCache in the backup directory so unchanged files are only read once.
     """
 
-    def __init__(self, use_hash: bool = False):
+    def __init__(
+        self,
+        use_hash: bool = False,
+        hash_cache: Optional[HashCache] = None,
+        stat_workers: Optional[int] = None,
+        use_cache: bool = True,
+    ):
         self.use_hash = use_hash
+        # Caller-owned cache; when None, detect_changes() opens one in the backup
+        self.hash_cache = hash_cache
+        # False keeps detect_changes() from creating a cache in the backup
+        # (dry runs must not write to the target)
+        self.use_cache = use_cache
+        # Threads for the backup-side stat walk (SMARTBACKUP_STAT_THREADS or 32)
+        self.stat_workers = stat_workers if stat_workers is not None else stat_workers_from_env()
 
     def detect_changes(
         self,
         source_files: Dict[Path, FileInfo],
         backup_path: Path,
         logger: BackupLogger,
+        stat_cache: Optional[Dict[str, os.stat_result]] = None,
     ) -> Tuple[List[FileInfo], List[FileInfo], List[Path]]:
         """
         Compares source and backup files.
 
+        Args:
+            source_files: Scanned source files keyed by relative path.
+            backup_path: Backup directory to compare against.
+            logger: Logger for progress output.
+            stat_cache: Optional stat results keyed by backup file path
+                (str), e.g. collected from os.scandir(). Entries found in it
+                take precedence over the detector's own walk.
+
         Returns:
             Tuple of (new_files, modified_files, files_to_delete)
         """
@@ -40,44 +134,83 @@ class ChangeDetector:
         modified_files: List[FileInfo] = []
         deleted_files: List[Path] = []
 
-        # Scan existing backup files
-        existing_backup_files: Set[Path] = set()
-        if backup_path.exists():
-            for path in backup_path.rglob("*"):
-                if path.is_file():
-                    relative = path.relative_to(backup_path)
-                    existing_backup_files.add(relative)
-
-        # Compare source files with backup
-        for relative_path, source_info in source_files.items():
-            backup_file = backup_path / relative_path
-
-            if not backup_file.exists():
-                new_files.append(source_info)
-            else:
-                # Check if modified
+        # Stat every existing backup file in one pass, keyed by relative path
+        backup_stats: Dict[str, os.stat_result] = {}
+        if backup_path.is_dir():
+            backup_stats = {
+                relative: stat
+                for relative, stat in _walk_files(os.fspath(backup_path), self.stat_workers)
+                # The hash cache (and its WAL files) is not part of the backup
+                if not relative.startswith(HASH_CACHE_FILENAME)
+            }
+
+        hash_cache = self.hash_cache
+        owns_cache = False
+        if self.use_hash and self.use_cache and hash_cache is None and backup_path.is_dir():
+            try:
+                hash_cache = HashCache(backup_path / HASH_CACHE_FILENAME)
+                owns_cache = True
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Hash cache unavailable, hashing without it: {e}")
+
+        try:
+            for relative_path, source_info in source_files.items():
+                # Whatever remains in backup_stats afterwards has no source file
+                key = os.fspath(relative_path)
+                backup_stat = backup_stats.pop(key, None)
+                if stat_cache:
+                    backup_stat = stat_cache.get(os.fspath(backup_path / relative_path), backup_stat)
+
+                if backup_stat is None:
+                    new_files.append(source_info)
+                    continue
+
+                # Size and mtime decide without building a FileInfo for the
+                # backup copy (same rules as FileInfo.needs_update)
+                if (
+                    backup_stat.st_size != source_info.size
+                    or backup_stat.st_mtime != source_info.mtime
+                ):
+                    modified_files.append(source_info)
+                    continue
+
+                # Only hash when size and mtime cannot tell the files apart
+                if not (self.use_hash and source_info.file_hash):
+                    continue
+
+                backup_file = backup_path / relative_path
                 try:
-                    backup_stat = backup_file.stat()
-                    backup_info = FileInfo(
-                        path=backup_file,
-                        relative_path=relative_path,
-                        size=backup_stat.st_size,
-                        mtime=backup_stat.st_mtime,
-                    )
-
-                    if source_info.needs_update(backup_info, self.use_hash):
+                    # Without a cached digest, a differing head settles
+                    # it before the whole backup copy is read
+                    if (
+                        backup_stat.st_size > HEAD_COMPARE_SIZE
+                        and (
+                            hash_cache is None
+                            or hash_cache.get(key, backup_stat.st_size, backup_stat.st_mtime_ns)
+                            is None
+                        )
+                        and _heads_differ(source_info.path, backup_file)
+                    ):
                         modified_files.append(source_info)
-
-                except Exception:
-                    # On error: mark as modified
+                        continue
+
+                    if hash_cache is not None:
+                        file_hash = hash_cache.digest(key, backup_file, backup_stat)
+                    else:
+                        file_hash = hash_file(backup_file)
+                except OSError:
+                    # Unreadable backup copy: recopy it
                     modified_files.append(source_info)
+                    continue
 
-            # Remove from existing
-            if relative_path in existing_backup_files:
-                existing_backup_files.remove(relative_path)
+                if file_hash != source_info.file_hash:
+                    modified_files.append(source_info)
+        finally:
+            if owns_cache:
+                hash_cache.close()
 
         # Remaining files in backup are deleted
-        deleted_files = [backup_path / p for p in existing_backup_files]
+        deleted_files = [backup_path / relative for relative in backup_stats]
 
         logger.info(
             f"Analysis completed: {len(new_files)} new, "
@@ -2,16 +2,19 @@
 BackupEngine - Core backup engine implementation.
 """
 
-import shutil
-import threading
+import os
+import stat
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from smartbackup.config import BackupConfig
 from smartbackup.core.detector import ChangeDetector
+from smartbackup.core.fastcopy import copy_file
 from smartbackup.core.scanner import ExclusionFilter, FileScanner
 from smartbackup.manifest.base import Manifest, ManifestManager
 from smartbackup.manifest.json_manifest import JsonManifestManager
@@ -19,6 +22,14 @@ from smartbackup.models import BackupResult, FileAction, FileInfo
 from smartbackup.ui.logger import BackupLogger
 
 
+def _stat_mode(path: Path) -> Optional[int]:
+    """Returns st_mode of path (one stat call), or None if it does not exist."""
+    try:
+        return os.stat(path).st_mode
+    except OSError:
+        return None
+
+
 class BackupEngine:
     """
     Main engine for the backup system.
@@ -35,7 +46,6 @@ class BackupEngine:
         self.config = config
         self.logger = logger
         self.result = BackupResult()
-        self._lock = threading.Lock()
         self._bytes_copied = 0
         self._files_processed = 0
         self._total_bytes = 0
@@ -104,7 +114,7 @@ class BackupEngine:
                 self.logger.info(f"Manifest diff: {diff.summary}")
             else:
                 # Fall back to traditional change detection
-                change_detector = ChangeDetector(self.config.use_hash_verification)
+                change_detector = self._create_change_detector()
                 new_files, modified_files, deleted_files = change_detector.detect_changes(
                     source_files, backup_target, self.logger
                 )
@@ -119,13 +129,13 @@ class BackupEngine:
             # 8. Perform backup
             self.logger.section("Starting backup operation...")
 
-            # Copy new files
-            if new_files:
-                self._copy_files(new_files, backup_target, FileAction.COPIED)
-
-            # Update modified files
-            if modified_files:
-                self._copy_files(modified_files, backup_target, FileAction.UPDATED)
+            # Copy new files and update modified files in a single pass
+            if new_files or modified_files:
+                jobs = chain(
+                    ((f, FileAction.COPIED) for f in new_files),
+                    ((f, FileAction.UPDATED) for f in modified_files),
+                )
+                self._copy_files(jobs, backup_target)
 
             # Optional: Delete old files
             # (Commented out for safety - can be enabled)
@@ -138,7 +148,10 @@ class BackupEngine:
             # 9. Update manifest with backed up files
             if self.config.use_manifest and self._manifest_manager and self._manifest:
                 self._manifest = self._manifest_manager.update_from_backup(
-                    self._manifest, self._backed_up_files, deleted_paths=None
+                    self._manifest,
+                    self._backed_up_files,
+                    deleted_paths=None,
+                    hash_algorithm=scanner.hash_algorithm,
                 )
                 if self._manifest_manager.save(self._manifest):
                     self.logger.success(
@@ -151,7 +164,9 @@ class BackupEngine:
             if self.config.compress_format:
                 from smartbackup.core.compressor import BackupCompressor
 
-                compressor = BackupCompressor(self.logger)
+                compressor = BackupCompressor(
+                    self.logger, max_workers=self.config.max_workers
+                )
                 archive_name = compressor.get_archive_name(
                     self.config.device_name or "backup",
                     self.config.compress_format,
@@ -219,13 +234,21 @@ class BackupEngine:
 
     def _validate_paths(self) -> bool:
         """Validates source and target paths."""
-        if not self.config.source_path.exists():
+        source_mode = _stat_mode(self.config.source_path)
+        if source_mode is None:
             self.logger.error(f"Source directory does not exist: {self.config.source_path}")
             return False
+        if not stat.S_ISDIR(source_mode):
+            self.logger.error(f"Source is not a directory: {self.config.source_path}")
+            return False
 
-        if not self.config.backup_path.exists():
+        backup_mode = _stat_mode(self.config.backup_path)
+        if backup_mode is None:
             self.logger.error(f"Backup medium not found: {self.config.backup_path}")
             return False
+        if not stat.S_ISDIR(backup_mode):
+            self.logger.error(f"Backup medium is not a directory: {self.config.backup_path}")
+            return False
 
         # Check write permissions
         try:
@@ -238,62 +261,89 @@ class BackupEngine:
 
         return True
 
-    def _copy_files(self, files: List[FileInfo], backup_target: Path, action: FileAction) -> None:
-        """Copies files with multithreading."""
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            futures = {
-                executor.submit(self._copy_single_file, f, backup_target, action): f for f in files
-            }
-
-            for future in as_completed(futures):
-                file_info = futures[future]
-                try:
-                    success, message = future.result()
-
-                    with self._lock:
-                        self._files_processed += 1
-
-                        if success:
-                            self._bytes_copied += file_info.size
-                            self._backed_up_files.append(file_info)  # Track for manifest
-
-                            if action == FileAction.COPIED:
-                                self.result.copied_files += 1
-                            else:
-                                self.result.updated_files += 1
-
-                            self.result.copied_size += file_info.size
-                            self.result.file_actions.append(
-                                (file_info.relative_path, action, message)
-                            )
-
-                            self.logger.file_action(
-                                action,
-                                file_info.relative_path,
-                                f"{file_info.size / 1024:.1f} KB",
-                            )
-                        else:
-                            self.result.errors += 1
-                            self.result.file_actions.append(
-                                (file_info.relative_path, FileAction.ERROR, message)
-                            )
-                            self.logger.file_action(
-                                FileAction.ERROR, file_info.relative_path, message
-                            )
-
-                        # Update progress
-                        self.logger.progress(
-                            self._files_processed,
-                            self._total_files,
-                            str(file_info.relative_path.name),
-                            self._bytes_copied,
-                            self._total_bytes,
-                        )
-
-                except Exception as e:
-                    with self._lock:
-                        self.result.errors += 1
-                    self.logger.error(f"Error at {file_info.path}: {e}")
+    def _create_change_detector(self) -> ChangeDetector:
+        """Creates the detector used when no manifest is available."""
+        return ChangeDetector(self.config.use_hash_verification)
+
+    def _copy_files(
+        self, jobs: Iterable[Tuple[FileInfo, FileAction]], backup_target: Path
+    ) -> None:
+        """
+        Copies files with multithreading.
+
+        Jobs are submitted lazily and at most 4 * max_workers copies are in
+        flight at once, so new and modified files share one worker pool
+        without queueing a future for every file up front. Workers only copy;
+        outcomes are recorded on this thread and the result counters are
+        written once when the pass is done.
+        """
+        max_in_flight = max(1, self.config.max_workers) * 4
+        pending: Dict[Future, Tuple[FileInfo, FileAction]] = {}
+        counts: Counter = Counter()
+        bytes_before = self._bytes_copied
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                for file_info, action in jobs:
+                    if len(pending) >= max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._record_copy_result(future, *pending.pop(future), counts)
+
+                    future = executor.submit(
+                        self._copy_single_file, file_info, backup_target, action
+                    )
+                    pending[future] = (file_info, action)
+
+                for future in as_completed(pending):
+                    self._record_copy_result(future, *pending[future], counts)
+        finally:
+            self.result.copied_files += counts[FileAction.COPIED]
+            self.result.updated_files += counts[FileAction.UPDATED]
+            self.result.errors += counts[FileAction.ERROR]
+            self.result.copied_size += self._bytes_copied - bytes_before
+
+    def _record_copy_result(
+        self,
+        future: Future,
+        file_info: FileInfo,
+        action: FileAction,
+        counts: Counter,
+    ) -> None:
+        """Records the outcome of a finished copy in counts and the log."""
+        try:
+            success, message = future.result()
+        except Exception as e:
+            counts[FileAction.ERROR] += 1
+            self.logger.error(f"Error at {file_info.path}: {e}")
+            return
+
+        self._files_processed += 1
+
+        if success:
+            self._bytes_copied += file_info.size
+            self._backed_up_files.append(file_info)  # Track for manifest
+            counts[action] += 1
+            self.result.file_actions.append((file_info.relative_path, action, message))
+
+            self.logger.file_action(
+                action,
+                file_info.relative_path,
+                f"{file_info.size / 1024:.1f} KB",
+            )
+        else:
+            counts[FileAction.ERROR] += 1
+            self.result.file_actions.append((file_info.relative_path, FileAction.ERROR, message))
+            self.logger.file_action(FileAction.ERROR, file_info.relative_path, message)
+
+        # Update progress
+        self.logger.progress(
+            self._files_processed,
+            self._total_files,
+            str(file_info.relative_path.name),
+            self._bytes_copied,
+            self._total_bytes,
+        )
 
     def _copy_single_file(
         self, file_info: FileInfo, backup_target: Path, action: FileAction
@@ -306,7 +356,7 @@ class BackupEngine:
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Copy file with metadata
-            shutil.copy2(file_info.path, dest_path)
+            copy_file(file_info.path, dest_path)
 
             return True, "OK"
 
@@ -398,6 +448,10 @@ class DryRunBackupEngine(BackupEngine):
     Performs all analyses but does not copy files.
     """
 
+    def _create_change_detector(self) -> ChangeDetector:
+        """Creates a detector that leaves the backup's hash cache alone."""
+        return ChangeDetector(self.config.use_hash_verification, use_cache=False)
+
     def _copy_single_file(
         self, file_info: FileInfo, backup_target: Path, action: FileAction
     ) -> Tuple[bool, str]:
@@ -0,0 +1,129 @@
+"""
+FastCopy - In-kernel file copying.
+
+On Linux a FICLONE reflink is tried first, which makes the copy a metadata
+operation on copy-on-write filesystems (Btrfs, XFS). Otherwise file contents
+are copied with os.copy_file_range where the platform offers it, which keeps
+the data in the kernel and allows server-side copies on NFS. Everywhere else
+shutil.copyfile is used, which already picks sendfile (Linux) or fcopyfile
+(macOS) internally.
+"""
+
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Errors that mean copy_file_range is unusable for this pair of files
+_FALLBACK_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EINVAL,
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.EBADF,
+        errno.EPERM,
+    }
+)
+
+# Maximum bytes requested per copy_file_range call
+_COPY_RANGE_CHUNK = 1 << 30
+
+# ioctl request that shares all of a file's extents with another (linux/fs.h)
+_FICLONE = 0x40049409 if sys.platform.startswith("linux") and fcntl is not None else None
+
+# Errors that mean the filesystem (or this pair of files) cannot be reflinked
+_CLONE_FALLBACK_ERRNOS = _FALLBACK_ERRNOS | {errno.ENOTTY}
+
+
+def _clone(src_fd: int, dst_fd: int) -> bool:
+    """
+    Reflinks src_fd into dst_fd with the FICLONE ioctl.
+
+    Returns:
+        True if the destination now shares the source's extents, False if
+        cloning is unsupported and the caller should copy instead
+    """
+    if _FICLONE is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError as e:
+        if e.errno in _CLONE_FALLBACK_ERRNOS:
+            return False
+        raise
+    return True
+
+
+def _copy_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copies size bytes from src_fd to dst_fd with os.copy_file_range.
+
+    Returns:
+        False if nothing was copied and the caller should fall back to a
+        regular copy, True once all bytes have been transferred
+    """
+    copied = 0
+    while copied < size:
+        try:
+            sent = os.copy_file_range(src_fd, dst_fd, min(size - copied, _COPY_RANGE_CHUNK))
+        except OSError as e:
+            if copied == 0 and e.errno in _FALLBACK_ERRNOS:
+                return False
+            raise
+        if sent == 0:
+            # Some filesystems (procfs, sysfs, ...) report zero; the file may
+            # also have shrunk underneath us. Only fall back if untouched.
+            return copied > 0
+        copied += sent
+    return True
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """
+    Copies src to dst including metadata, like shutil.copy2.
+
+    Args:
+        src: Source file
+        dst: Destination file (overwritten if it exists)
+
+    Raises:
+        shutil.SameFileError: If src and dst are the same file (e.g. hard links)
+    """
+    if _FICLONE is not None or hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc:
+            src_stat = os.fstat(fsrc.fileno())
+            # Opening dst for writing truncates it, so check before, like
+            # shutil.copyfile does
+            try:
+                dst_stat = os.stat(dst)
+            except FileNotFoundError:
+                pass
+            else:
+                if os.path.samestat(src_stat, dst_stat):
+                    raise shutil.SameFileError(
+                        f"{src!r} and {dst!r} are the same file"
+                    )
+            with open(dst, "wb") as fdst:
+                size = src_stat.st_size
+                done = (
+                    size == 0
+                    or _clone(fsrc.fileno(), fdst.fileno())
+                    or (
+                        hasattr(os, "copy_file_range")
+                        and _copy_range(fsrc.fileno(), fdst.fileno(), size)
+                    )
+                )
+        if not done:
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
@@ -0,0 +1,88 @@
+"""
+HashCache - Persistent cache of file content hashes.
+
+Stores each file's SHA-256 digest together with the size and mtime it was
+computed for, so files that have not changed since the last run are not
+read again. The cache is a SQLite database in WAL mode.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from smartbackup.hashing import hash_file
+
+# Cache database name, created in the root of the backup target
+HASH_CACHE_FILENAME = ".smartbackup_hashcache.sqlite"
+
+
+class HashCache:
+    """
+    SQLite-backed map of path -> (size, mtime_ns, digest).
+
+    A cached digest is only returned while the file's size and mtime still
+    match the values it was computed for.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(os.fspath(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "digest TEXT NOT NULL)"
+        )
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """Returns the cached digest for path if size and mtime still match."""
+        row = self._conn.execute(
+            "SELECT digest FROM hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, size, mtime_ns),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        """Stores (or replaces) the digest for path."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+            (path, size, mtime_ns, digest),
+        )
+
+    def digest(self, key: str, file_path: Path, stat: os.stat_result) -> str:
+        """
+        Returns the SHA-256 digest of file_path, hashing it only on a cache miss.
+
+        Args:
+            key: Cache key for the file (e.g. its path relative to the backup)
+            file_path: File to hash on a miss
+            stat: Current stat result of file_path
+        """
+        digest = self.get(key, stat.st_size, stat.st_mtime_ns)
+        if digest is not None:
+            self.hits += 1
+            return digest
+
+        self.misses += 1
+        digest = hash_file(file_path)
+        self.put(key, stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def close(self) -> None:
+        """Commits pending entries and closes the database."""
+        try:
+            self._conn.commit()
+        finally:
+            self._conn.close()
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -2,25 +2,58 @@
 RestoreEngine - Core restore engine implementation.
 """
 
+import errno
 import fnmatch
-import shutil
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum, auto
+from enum import IntEnum, auto
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
 
+from smartbackup.core.fastcopy import copy_file
+from smartbackup.manifest.base import Manifest
 from smartbackup.manifest.json_manifest import JsonManifestManager
 from smartbackup.models import FileAction
 from smartbackup.ui.logger import BackupLogger
 
-
-class ConflictResolution(Enum):
+# Copy threads used by restores; restoring is mostly waiting on per-file I/O
+DEFAULT_RESTORE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Top-level names in a backup that belong to SmartBackup, not to the user
+_INTERNAL_PREFIXES = ("_backup_logs", ".smartbackup")
+
+# os.link() errors after which the file is copied instead
+_LINK_FALLBACK_ERRNOS = frozenset(
+    {
+        errno.EXDEV,  # backup and target are on different filesystems
+        errno.EPERM,
+        errno.EACCES,
+        errno.EMLINK,
+        errno.ENOTSUP,
+        errno.EOPNOTSUPP,
+    }
+)
+
+
+def _try_link(source: Path, destination: Path) -> bool:
+    """Hard-links source to destination, returning False if the caller should copy."""
+    try:
+        os.link(source, destination)
+    except OSError as e:
+        if e.errno in _LINK_FALLBACK_ERRNOS:
+            return False
+        raise
+    return True
+
+
+class ConflictResolution(IntEnum):
     """How to handle file conflicts during restore."""
 
     SKIP = auto()  # Skip existing files
@@ -29,6 +62,47 @@ class ConflictResolution(Enum):
     NEWER = auto()  # Only overwrite if backup is newer
 
 
+# A resolver gets (backup file, existing target) and returns the path to
+# restore to, or None and the reason the file is skipped
+ConflictResolver = Callable[[Path, Path], Tuple[Optional[Path], str]]
+
+
+def _resolve_skip(source: Path, target: Path) -> Tuple[Optional[Path], str]:
+    """Keeps the existing file."""
+    return None, "File exists"
+
+
+def _resolve_overwrite(source: Path, target: Path) -> Tuple[Optional[Path], str]:
+    """Replaces the existing file."""
+    return target, ""
+
+
+def _resolve_rename(source: Path, target: Path) -> Tuple[Optional[Path], str]:
+    """Restores next to the existing file as 'name (restored N).ext'."""
+    counter = 1
+    while True:
+        label = " (restored)" if counter == 1 else f" (restored {counter})"
+        candidate = target.with_name(f"{target.stem}{label}{target.suffix}")
+        if not candidate.exists():
+            return candidate, ""
+        counter += 1
+
+
+def _resolve_newer(source: Path, target: Path) -> Tuple[Optional[Path], str]:
+    """Replaces the existing file only if the backup copy is newer."""
+    if source.stat().st_mtime <= target.stat().st_mtime:
+        return None, "Target is newer"
+    return target, ""
+
+
+_CONFLICT_RESOLVERS: Dict[ConflictResolution, ConflictResolver] = {
+    ConflictResolution.SKIP: _resolve_skip,
+    ConflictResolution.OVERWRITE: _resolve_overwrite,
+    ConflictResolution.RENAME: _resolve_rename,
+    ConflictResolution.NEWER: _resolve_newer,
+}
+
+
 @dataclass
 class RestoreResult:
     """Result of a restore operation."""
@@ -77,6 +151,8 @@ class RestoreEngine:
         logger: Optional[BackupLogger] = None,
         backup_folder: str = "Documents-Backup",
         device_name: str = "",
+        max_workers: Optional[int] = None,
+        hardlink_when_possible: bool = False,
     ):
         """
         Initialize restore engine.
@@ -87,6 +163,11 @@ class RestoreEngine:
             logger: Logger for output
             backup_folder: Name of the backup folder
             device_name: Device subfolder name (empty = auto-detect or legacy)
+            max_workers: Copy threads (default: DEFAULT_RESTORE_WORKERS)
+            hardlink_when_possible: Hard-link restored files to the backup copies
+                when both are on the same filesystem instead of copying them.
+                Restored files then share their data with the backup, so an
+                in-place edit of one changes the other.
         """
         self.backup_path = backup_path
         self.backup_folder = backup_folder
@@ -107,15 +188,37 @@ class RestoreEngine:
         self.target_path = target_path
         self.logger = logger or BackupLogger(verbose=True)
         self.result = RestoreResult()
-        self._lock = threading.Lock()
+        self.max_workers = max_workers if max_workers is not None else DEFAULT_RESTORE_WORKERS
+        self.hardlink_when_possible = hardlink_when_possible
         self._manifest_manager = JsonManifestManager(self.backup_target)
+        # ((mtime_ns, size) of the manifest file, manifest) of the last load
+        self._manifest_cache: Optional[Tuple[Tuple[int, int], Optional[Manifest]]] = None
+
+    def _load_manifest(self) -> Optional[Manifest]:
+        """
+        Loads the backup's manifest.
+
+        The parsed manifest is reused until the file's mtime or size changes,
+        so restore() and get_manifest_info() parse it once between them.
+        The engine only reads the manifest, so sharing it is safe.
+        """
+        try:
+            stat = self._manifest_manager.manifest_path.stat()
+        except OSError:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._manifest_cache is None or self._manifest_cache[0] != key:
+            self._manifest_cache = (key, self._manifest_manager.load())
+        return self._manifest_cache[1]
 
     def restore(
         self,
         patterns: Optional[List[str]] = None,
         overwrite: bool = False,
         dry_run: bool = False,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
+        conflict_resolution: Optional[ConflictResolution] = None,
     ) -> RestoreResult:
         """
         Perform the restore operation.
@@ -124,6 +227,8 @@ class RestoreEngine:
             patterns: Optional glob patterns to filter files
             overwrite: Whether to overwrite existing files
             dry_run: Preview without actual restore
+            max_workers: Copy threads for this run (default: the engine's max_workers)
+            conflict_resolution: How to handle existing files; overrides overwrite
 
         Returns:
             RestoreResult with statistics
@@ -140,7 +245,7 @@ class RestoreEngine:
             # 2. Determine target path
             if self.target_path is None:
                 # Try to get original source from manifest
-                manifest = self._manifest_manager.load()
+                manifest = self._load_manifest()
                 if manifest and manifest.source:
                     self.target_path = Path(manifest.source)
                     self.logger.info(f"Restoring to original source: {self.target_path}")
@@ -149,27 +254,34 @@ class RestoreEngine:
                     self.result.errors = 1
                     return self.result
 
-            # 3. Collect files to restore
-            files_to_restore = self._collect_files(patterns)
+            # 3. Stream the files to restore into the worker pool; nothing is
+            # listed up front, so the first file is copied right away
+            files_to_restore = self._iter_files(patterns)
+            first = next(files_to_restore, None)
 
-            if not files_to_restore:
+            if first is None:
                 self.logger.warning("No files to restore!")
                 return self.result
 
-            self.result.total_files = len(files_to_restore)
-            self.result.total_size = sum(f.stat().st_size for f in files_to_restore)
-
-            self.logger.info(f"Found {len(files_to_restore)} files to restore")
-            self.logger.info(f"Total size: {self.result.total_size / (1024 * 1024):.2f} MB")
-
             # 4. Perform restore
             self.logger.section("Starting restore operation...")
 
-            conflict_resolution = (
-                ConflictResolution.OVERWRITE if overwrite else ConflictResolution.SKIP
+            if conflict_resolution is None:
+                conflict_resolution = (
+                    ConflictResolution.OVERWRITE if overwrite else ConflictResolution.SKIP
+                )
+
+            self._restore_files(
+                chain((first,), files_to_restore),
+                conflict_resolution,
+                dry_run,
+                max_workers if max_workers is not None else self.max_workers,
             )
 
-            self._restore_files(files_to_restore, conflict_resolution, dry_run, max_workers)
+            self.logger.info(
+                f"Processed {self.result.total_files} files "
+                f"({self.result.total_size / (1024 * 1024):.2f} MB)"
+            )
 
         except Exception as e:
             self.logger.error(f"Restore error: {e}")
@@ -181,81 +293,133 @@ class RestoreEngine:
 
         return self.result
 
-    def _collect_files(self, patterns: Optional[List[str]] = None) -> List[Path]:
+    def _iter_files(self, patterns: Optional[List[str]] = None) -> Iterator[Tuple[Path, int]]:
         """
-        Collect files to restore based on patterns.
+        Yield the files to restore, filtered by patterns.
 
         Args:
             patterns: Optional glob patterns to filter files
 
-        Returns:
-            List of file paths to restore
+        Yields:
+            (backup file path, size) tuples
         """
-        files = []
-
-        for path in self.backup_target.rglob("*"):
-            if path.is_file():
-                # Skip internal files
-                relative = path.relative_to(self.backup_target)
-                if str(relative).startswith("_backup_logs") or str(relative).startswith(
-                    ".smartbackup"
-                ):
-                    continue
+        yield from self._walk_backup(
+            os.fspath(self.backup_target), "", self._compile_patterns(patterns)
+        )
+
+    def _walk_backup(
+        self,
+        directory: str,
+        relative_dir: str,
+        matcher: Optional[Callable[[str], Optional[re.Match[str]]]],
+    ) -> Iterator[Tuple[Path, int]]:
+        """
+        Recursive scandir walk below the backup target.
+
+        SmartBackup's own top-level entries (_backup_logs, .smartbackup*) are
+        skipped by name before anything is stat()ed or entered.
+        """
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except PermissionError:
+            # Unreadable folders are skipped, as Path.rglob() did
+            return
+
+        for entry in entries:
+            if not relative_dir and entry.name.startswith(_INTERNAL_PREFIXES):
+                continue
 
+            relative = relative_dir + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._walk_backup(entry.path, relative + os.sep, matcher)
+            elif entry.is_file():
                 # Apply pattern filter if specified
-                if patterns:
-                    match = False
-                    for pattern in patterns:
-                        if fnmatch.fnmatch(str(relative), pattern):
-                            match = True
-                            break
-                    if not match:
-                        continue
+                if matcher is not None and not matcher(os.path.normcase(relative)):
+                    continue
+                yield Path(entry.path), entry.stat().st_size
+
+    @staticmethod
+    def _compile_patterns(
+        patterns: Optional[List[str]],
+    ) -> Optional[Callable[[str], Optional[re.Match[str]]]]:
+        """
+        Compiles glob patterns into one regex match function.
 
-                files.append(path)
+        Matches like fnmatch.fnmatch() against any of the patterns, but with a
+        single regex call per path. Paths must be passed through
+        os.path.normcase(), as fnmatch does.
 
-        return files
+        Returns:
+            The match function, or None if there are no patterns
+        """
+        if not patterns:
+            return None
+        regex = "|".join(
+            f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns
+        )
+        return re.compile(regex).match
 
     def _restore_files(
         self,
-        files: List[Path],
+        files: Iterable[Tuple[Path, int]],
         conflict_resolution: ConflictResolution,
         dry_run: bool,
         max_workers: int,
     ) -> None:
-        """Restore files with multithreading."""
+        """
+        Restore files with multithreading.
+
+        Files are pulled from the iterable as workers free up: at most
+        4 * max_workers restores are in flight at once. Workers only copy;
+        outcomes are recorded on this thread, so the result needs no lock.
+        """
+        max_workers = max(1, max_workers)
+        max_in_flight = max_workers * 4
+        pending: Dict[Future, Tuple[Path, int]] = {}
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self._restore_single_file, f, conflict_resolution, dry_run): f
-                for f in files
-            }
-
-            for future in as_completed(futures):
-                file_path = futures[future]
-                try:
-                    success, action, message = future.result()
-                    relative = file_path.relative_to(self.backup_target)
-
-                    with self._lock:
-                        if success:
-                            if action == FileAction.COPIED:
-                                self.result.restored_files += 1
-                                self.result.restored_size += file_path.stat().st_size
-                            elif action == FileAction.UPDATED:
-                                self.result.overwritten_files += 1
-                                self.result.restored_size += file_path.stat().st_size
-                            elif action == FileAction.SKIPPED:
-                                self.result.skipped_files += 1
-                        else:
-                            self.result.errors += 1
-
-                        self.result.file_actions.append((relative, action, message))
-                        self.logger.file_action(action, relative, message)
-
-                except Exception as e:
-                    with self._lock:
-                        self.result.errors += 1
-                    self.logger.error(f"Error restoring {file_path}: {e}")
+            for file_path, size in files:
+                self.result.total_files += 1
+                self.result.total_size += size
+
+                if len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._record_restore_result(future, *pending.pop(future))
+
+                future = executor.submit(
+                    self._restore_single_file, file_path, conflict_resolution, dry_run
+                )
+                pending[future] = (file_path, size)
+
+            for future in as_completed(pending):
+                self._record_restore_result(future, *pending[future])
+
+    def _record_restore_result(self, future: Future, file_path: Path, size: int) -> None:
+        """Records the outcome of a finished restore in the result and the log."""
+        try:
+            success, action, message = future.result()
+            relative = file_path.relative_to(self.backup_target)
+
+            if success:
+                if action == FileAction.COPIED:
+                    self.result.restored_files += 1
+                    self.result.restored_size += size
+                elif action == FileAction.UPDATED:
+                    self.result.overwritten_files += 1
+                    self.result.restored_size += size
+                elif action == FileAction.SKIPPED:
+                    self.result.skipped_files += 1
+            else:
+                self.result.errors += 1
+
+            self.result.file_actions.append((relative, action, message))
+            self.logger.file_action(action, relative, message)
+
+        except Exception as e:
+            self.result.errors += 1
+            self.logger.error(f"Error restoring {file_path}: {e}")
 
     def _restore_single_file(
         self,
@@ -282,30 +446,30 @@ class RestoreEngine:
             target = target_path / relative
 
             # Check for existing file
+            action = FileAction.COPIED
             if target.exists():
-                if conflict_resolution == ConflictResolution.SKIP:
-                    return True, FileAction.SKIPPED, "File exists"
-                elif conflict_resolution == ConflictResolution.NEWER:
-                    source_mtime = source_path.stat().st_mtime
-                    target_mtime = target.stat().st_mtime
-                    if source_mtime <= target_mtime:
-                        return True, FileAction.SKIPPED, "Target is newer"
+                resolved, reason = _CONFLICT_RESOLVERS[conflict_resolution](source_path, target)
+                if resolved is None:
+                    return True, FileAction.SKIPPED, reason
+                if resolved == target:
+                    action = FileAction.UPDATED
+                target = resolved
 
             if dry_run:
-                if target.exists():
-                    return True, FileAction.UPDATED, "DRY-RUN"
-                return True, FileAction.COPIED, "DRY-RUN"
+                return True, action, "DRY-RUN"
 
             # Create target directory
             target.parent.mkdir(parents=True, exist_ok=True)
 
-            # Determine action
-            action = FileAction.UPDATED if target.exists() else FileAction.COPIED
-
             # Copy file with metadata (atomic pattern)
             temp_path = target.with_suffix(target.suffix + ".tmp")
             try:
-                shutil.copy2(source_path, temp_path)
+                # A stale temp from an interrupted restore may be a hard link
+                # to the backup file; writing through it would truncate the
+                # backup, so start from a fresh name
+                temp_path.unlink(missing_ok=True)
+                if not (self.hardlink_when_possible and _try_link(source_path, temp_path)):
+                    copy_file(source_path, temp_path)
                 temp_path.replace(target)
             except Exception:
                 temp_path.unlink(missing_ok=True)
@@ -363,8 +527,10 @@ class RestoreEngine:
         Returns:
             List of (relative_path, size) tuples
         """
-        files = self._collect_files(patterns)
-        return [(f.relative_to(self.backup_target), f.stat().st_size) for f in files]
+        return [
+            (path.relative_to(self.backup_target), size)
+            for path, size in self._iter_files(patterns)
+        ]
 
     def get_manifest_info(self) -> Optional[dict]:
         """
@@ -373,7 +539,7 @@ class RestoreEngine:
         Returns:
             Dictionary with manifest info or None
         """
-        manifest = self._manifest_manager.load()
+        manifest = self._load_manifest()
         if manifest is None:
             return None
 
@@ -2,15 +2,29 @@
 Scanner - File scanning and exclusion filtering.
 """
 
-import hashlib
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
+from smartbackup.hashing import hash_file
 from smartbackup.models import FileInfo
+from smartbackup.parallel import parallel_map, stat_workers_from_env
 from smartbackup.ui.logger import BackupLogger
 
+# Wildcard patterns that only match on a file extension, like "*.tmp"
+_SUFFIX_PATTERN = re.compile(r"\*\.[A-Za-z0-9]+")
+
+# Paths (relative to a directory) whose presence marks a virtual environment
+_VENV_MARKERS = (
+    ("pyvenv.cfg",),
+    ("Scripts", "activate"),  # Windows
+    ("bin", "activate"),  # Unix
+    ("Scripts", "python.exe"),
+    ("bin", "python"),
+    ("lib", "python3"),  # Standard venv structure
+)
+
 
 class ExclusionFilter:
     """
@@ -26,59 +40,124 @@ class ExclusionFilter:
         self.exact_matches: Set[str] = set()
         self.patterns: List[re.Pattern[str]] = []
         self.excluded_extensions = {ext.lower() for ext in excluded_extensions}
+        # "*.ext" patterns by lowercased ".ext", mapped to their regex for reasons
+        self.pattern_suffixes: Dict[str, str] = {}
 
         for excl in exclusions:
             if "*" in excl or "?" in excl:
                 # Convert glob pattern to regex
                 regex = excl.replace(".", r"\.").replace("*", ".*").replace("?", ".")
-                self.patterns.append(re.compile(f"^{regex}$", re.IGNORECASE))
+                if _SUFFIX_PATTERN.fullmatch(excl):
+                    # Matched with a dict lookup on the name's last extension
+                    self.pattern_suffixes[excl[1:].lower()] = f"^{regex}$"
+                else:
+                    self.patterns.append(re.compile(f"^{regex}$", re.IGNORECASE))
             else:
                 self.exact_matches.add(excl.lower())
 
-    def should_exclude(self, path: Path) -> Tuple[bool, str]:
+        # All patterns as one alternation, so a name is matched in a single
+        # regex call; the named group that matched identifies the pattern
+        self._combined_pattern = (
+            re.compile(
+                "|".join(
+                    f"(?P<p{index}>{pattern.pattern})"
+                    for index, pattern in enumerate(self.patterns)
+                ),
+                re.IGNORECASE,
+            )
+            if self.patterns
+            else None
+        )
+
+    def should_exclude(
+        self, path: Path, children: Optional[Set[str]] = None
+    ) -> Tuple[bool, str]:
         """
         Checks if a path should be excluded.
 
+        Args:
+            path: File or folder to check
+            children: Lowercased names inside path, if the caller has already
+                listed it (saves the filesystem probes of venv detection)
+
         Returns:
             Tuple (should_be_excluded, reason)
         """
-        name = path.name.lower()
+        excluded, reason = self.match_name(path.name)
+        if excluded:
+            return True, reason
 
-        # Exact match
-        if name in self.exact_matches:
-            return True, f"Exact match: {name}"
+        # Special check for virtual environments
+        if self.is_virtual_env(path, children):
+            return True, "Virtual environment detected"
 
-        # Check file extension
-        if path.suffix.lower() in self.excluded_extensions:
-            return True, f"Excluded extension: {path.suffix}"
+        return False, ""
 
-        # Pattern match
-        for pattern in self.patterns:
-            if pattern.match(name):
-                return True, f"Pattern match: {pattern.pattern}"
+    def match_name(self, name: str) -> Tuple[bool, str]:
+        """
+        Checks a bare file or folder name against the name-based rules.
 
-        # Special check for virtual environments
-        if self._is_virtual_env(path):
-            return True, "Virtual environment detected"
+        Unlike should_exclude(), this never touches the filesystem.
+
+        Returns:
+            Tuple (should_be_excluded, reason)
+        """
+        lower_name = name.lower()
+
+        # Exact match
+        if lower_name in self.exact_matches:
+            return True, f"Exact match: {lower_name}"
+
+        # Check file extension (rule sets are lowercased once in __init__)
+        suffix = os.path.splitext(lower_name)[1]
+        if suffix in self.excluded_extensions:
+            return True, f"Excluded extension: {name[len(name) - len(suffix):]}"
+
+        # Pattern match ("*.ext" patterns first, by the last extension)
+        if self.pattern_suffixes:
+            dot = lower_name.rfind(".")
+            if dot != -1:
+                suffix_pattern = self.pattern_suffixes.get(lower_name[dot:])
+                if suffix_pattern is not None:
+                    return True, f"Pattern match: {suffix_pattern}"
+
+        if self._combined_pattern is not None:
+            match = self._combined_pattern.match(lower_name)
+            if match:
+                pattern = self.patterns[int(match.lastgroup[1:])]
+                return True, f"Pattern match: {pattern.pattern}"
 
         return False, ""
 
-    def _is_virtual_env(self, path: Path) -> bool:
-        """Detects virtual environments by their structure."""
-        if not path.is_dir():
+    def is_virtual_env(
+        self, path: Union[str, Path], children: Optional[Set[str]] = None
+    ) -> bool:
+        """
+        Detects virtual environments by their structure.
+
+        Args:
+            path: Directory to check
+            children: Lowercased names inside path, if already listed; only
+                markers under a listed name are then probed on disk
+        """
+        if children is None and not os.path.isdir(path):
             return False
 
-        # Python venv indicators
-        venv_indicators = [
-            path / "pyvenv.cfg",
-            path / "Scripts" / "activate",  # Windows
-            path / "bin" / "activate",  # Unix
-            path / "Scripts" / "python.exe",
-            path / "bin" / "python",
-            path / "lib" / "python3",  # Standard venv structure
-        ]
+        return self._has_venv_markers(path, children)
 
-        return any(indicator.exists() for indicator in venv_indicators[:6])
+    def _has_venv_markers(
+        self, path: Union[str, Path], children: Optional[Set[str]] = None
+    ) -> bool:
+        """Checks a directory for the files a virtual environment contains."""
+        for marker in _VENV_MARKERS:
+            if children is not None:
+                if marker[0].lower() not in children:
+                    continue
+                if len(marker) == 1:
+                    return True
+            if os.path.exists(os.path.join(path, *marker)):
+                return True
+        return False
 
 
 class FileScanner:
@@ -98,14 +177,22 @@ class FileScanner:
         use_hash: bool = False,
         hash_all: bool = False,
         max_size_for_hash: int = 50 * 1024 * 1024,  # 50MB
+        hash_algorithm: str = "sha256",
+        max_workers: Optional[int] = None,
     ):
         self.filter = exclusion_filter
         self.logger = logger
         self.use_hash = use_hash
         self.hash_all = hash_all
         self.max_size_for_hash = max_size_for_hash
+        # hashlib name; SHA-256 runs on SHA-NI via OpenSSL where the CPU has it
+        self.hash_algorithm = hash_algorithm
+        # Threads that stat and hash scanned files (SMARTBACKUP_STAT_THREADS or 32)
+        self.max_workers = max_workers if max_workers is not None else stat_workers_from_env()
         self._scan_count = 0
         self._excluded_count = 0
+        # match_name() results by entry name, kept for the duration of one scan
+        self._name_decisions: Dict[str, Tuple[bool, str]] = {}
 
     def scan(self, base_path: Path) -> Dict[Path, FileInfo]:
         """
@@ -122,13 +209,18 @@ class FileScanner:
         self._excluded_count = 0
 
         files: Dict[Path, FileInfo] = {}
+        pending: List[Tuple[Path, os.DirEntry]] = []
 
         try:
-            self._scan_recursive(base_path, base_path, files)
+            self._scan_recursive(os.fspath(base_path), Path(), pending)
         except PermissionError as e:
             self.logger.error(f"Permission denied: {e}")
         except Exception as e:
             self.logger.error(f"Scan error: {e}")
+        finally:
+            self._name_decisions = {}
+
+        self._collect_files(pending, files)
 
         self.logger.info(
             f"Scan completed: {self._scan_count} files found, {self._excluded_count} excluded"
@@ -137,72 +229,95 @@ class FileScanner:
         return files
 
     def _scan_recursive(
-        self, current_path: Path, base_path: Path, files: Dict[Path, FileInfo]
+        self, current_path: str, relative_dir: Path, pending: List[Tuple[Path, os.DirEntry]]
     ) -> None:
-        """Recursive scan implementation."""
+        """Recursive traversal; queues (relative_path, entry) for every file found."""
         try:
-            with os.scandir(current_path) as entries:
-                for entry in entries:
-                    try:
-                        path = Path(entry.path)
-
-                        # Check exclusion
-                        should_exclude, reason = self.filter.should_exclude(path)
-                        if should_exclude:
-                            self._excluded_count += 1
-                            if entry.is_dir():
-                                # Skip entire folder
-                                continue
-                            else:
-                                continue
-
-                        if entry.is_dir(follow_symlinks=False):
-                            # Recursively enter subdirectory
-                            self._scan_recursive(path, base_path, files)
-
-                        elif entry.is_file(follow_symlinks=False):
-                            self._scan_count += 1
-
-                            # Show progress
-                            if self._scan_count % 100 == 0:
-                                self.logger.progress(
-                                    self._scan_count,
-                                    self._scan_count,  # Unknown total
-                                    str(path.name),
-                                )
-
-                            stat = entry.stat()
-                            relative_path = path.relative_to(base_path)
-
-                            # Optional: Calculate hash
-                            file_hash = None
-                            if self.use_hash:
-                                if self.hash_all or stat.st_size <= self.max_size_for_hash:
-                                    file_hash = self._calculate_hash(path)
-
-                            files[relative_path] = FileInfo(
-                                path=path,
-                                relative_path=relative_path,
-                                size=stat.st_size,
-                                mtime=stat.st_mtime,
-                                file_hash=file_hash,
-                            )
-
-                    except PermissionError:
-                        self._excluded_count += 1
-                    except Exception as e:
-                        self.logger.warning(f"Error at {entry.path}: {e}")
-
+            with os.scandir(current_path) as iterator:
+                entries = list(iterator)
         except PermissionError:
             self.logger.warning(f"Permission denied for: {current_path}")
+            return
+
+        # Subfolders are checked for venvs against their own listing, which
+        # needs no extra stat() unless a bin/Scripts/lib folder is present
+        if relative_dir.parts and self.filter.is_virtual_env(
+            current_path, {entry.name.lower() for entry in entries}
+        ):
+            self._excluded_count += 1
+            return
+
+        for entry in entries:
+            try:
+                # Check exclusion (excluded folders are never entered); names
+                # like __init__.py or src repeat across a tree, so the
+                # decision for each name is computed once per scan
+                decision = self._name_decisions.get(entry.name)
+                if decision is None:
+                    decision = self._name_decisions[entry.name] = self.filter.match_name(
+                        entry.name
+                    )
+                should_exclude, reason = decision
+                if should_exclude:
+                    self._excluded_count += 1
+                    continue
+
+                if entry.is_dir(follow_symlinks=False):
+                    # Recursively enter subdirectory
+                    self._scan_recursive(entry.path, relative_dir / entry.name, pending)
+
+                elif entry.is_file(follow_symlinks=False):
+                    self._scan_count += 1
+
+                    # Show progress
+                    if self._scan_count % 100 == 0:
+                        self.logger.progress(
+                            self._scan_count,
+                            self._scan_count,  # Unknown total
+                            entry.name,
+                        )
+
+                    pending.append((relative_dir / entry.name, entry))
+
+            except PermissionError:
+                self._excluded_count += 1
+            except Exception as e:
+                self.logger.warning(f"Error at {entry.path}: {e}")
+
+    def _collect_files(
+        self, pending: List[Tuple[Path, os.DirEntry]], files: Dict[Path, FileInfo]
+    ) -> None:
+        """Stats (and optionally hashes) the queued files, in traversal order."""
+        # stat() and hashlib both release the GIL, so threads overlap the I/O
+        results = parallel_map(self._file_info, pending, self.max_workers)
+
+        for (relative_path, entry), result in zip(pending, results):
+            if isinstance(result, PermissionError):
+                self._excluded_count += 1
+            elif isinstance(result, Exception):
+                self.logger.warning(f"Error at {entry.path}: {result}")
+            else:
+                files[relative_path] = result
+
+    def _file_info(self, item: Tuple[Path, os.DirEntry]) -> Union[FileInfo, Exception]:
+        """Builds the FileInfo for a queued file, returning the error instead of raising."""
+        relative_path, entry = item
+        try:
+            stat = entry.stat(follow_symlinks=False)
+
+            # Optional: Calculate hash
+            file_hash = None
+            if self.use_hash:
+                if self.hash_all or stat.st_size <= self.max_size_for_hash:
+                    file_hash = self._calculate_hash(Path(entry.path))
+
+            return FileInfo.from_direntry(entry, relative_path, file_hash)
+        except Exception as e:
+            return e
 
-    def _calculate_hash(self, path: Path, chunk_size: int = 65536) -> str:
-        """Calculate SHA-256 hash of a file for integrity verification."""
-        hasher = hashlib.sha256()
+    def _calculate_hash(self, path: Path) -> str:
+        """Calculate the file's hash (hash_algorithm) for integrity verification."""
         try:
-            with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            return hash_file(path, self.hash_algorithm)
         except Exception:
             return ""
@@ -0,0 +1,38 @@
+"""
+Hashing - File content digests shared by the scanner, detector and manifest.
+"""
+
+import hashlib
+from pathlib import Path
+
+# Read buffer size for hashing on Python < 3.11
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# hashlib.file_digest() (Python 3.11+) reads into a reused buffer in C
+_file_digest = getattr(hashlib, "file_digest", None)
+
+
+def hash_file(path: Path, algorithm: str = "sha256") -> str:
+    """
+    Calculate the hex digest of a file's content.
+
+    Args:
+        path: File to hash
+        algorithm: Any algorithm name accepted by hashlib.new()
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        if _file_digest is not None:
+            return _file_digest(f, algorithm).hexdigest()
+
+        hasher = hashlib.new(algorithm)
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+    return hasher.hexdigest()
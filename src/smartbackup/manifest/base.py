@@ -2,16 +2,26 @@
 Manifest Base - Base classes for manifest tracking.
 """
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Union
 
-import hashlib
+from smartbackup.hashing import hash_file
+from smartbackup.models import DATACLASS_SLOTS, FileInfo
+from smartbackup.parallel import parallel_map
 
-from smartbackup.models import FileInfo
+
+def _stat_path(path: Path) -> Union[os.stat_result, OSError]:
+    """Stats path, returning the error instead of raising it."""
+    try:
+        return path.stat()
+    except OSError as e:
+        return e
 
 
 class ManifestFormat(Enum):
@@ -21,7 +31,7 @@ class ManifestFormat(Enum):
     SQLITE = "sqlite"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ManifestEntry:
     """
     Represents a single file entry in the manifest.
@@ -43,7 +53,7 @@ class ManifestEntry:
             "size": self.size,
             "mtime": self.mtime,
             "permissions": self.permissions,
-            "backed_up_at": self.backed_up_at,
+            "backed_up_at": int(self.backed_up_at),
         }
 
     @classmethod
@@ -55,7 +65,7 @@ class ManifestEntry:
             size=data.get("size", 0),
             mtime=data.get("mtime", 0.0),
             permissions=data.get("permissions", 0o644),
-            backed_up_at=data.get("backed_up_at", 0.0),
+            backed_up_at=float(data.get("backed_up_at", 0)),
         )
 
     @classmethod
@@ -66,11 +76,13 @@ class ManifestEntry:
         if backed_up_at is None:
             backed_up_at = datetime.now().timestamp()
 
-        # Get permissions from file
-        try:
-            permissions = file_info.path.stat().st_mode
-        except (OSError, IOError):
-            permissions = 0o644
+        # Get permissions from the scan, or from the file if not recorded
+        permissions = file_info.mode
+        if permissions is None:
+            try:
+                permissions = file_info.path.stat().st_mode
+            except (OSError, IOError):
+                permissions = 0o644
 
         return cls(
             relative_path=str(file_info.relative_path),
@@ -167,7 +179,17 @@ class Manifest:
             "backup_count": self.backup_count,
             "total_files": self.total_files,
             "total_size": self.total_size,
-            "files": {path: entry.to_dict() for path, entry in self.entries.items()},
+            # ManifestEntry.to_dict(), inlined for the per-file loop
+            "files": {
+                path: {
+                    "hash": entry.file_hash,
+                    "size": entry.size,
+                    "mtime": entry.mtime,
+                    "permissions": entry.permissions,
+                    "backed_up_at": int(entry.backed_up_at),
+                }
+                for path, entry in self.entries.items()
+            },
         }
 
     @classmethod
@@ -184,15 +206,25 @@ class Manifest:
             backup_count=data.get("backup_count", 0),
         )
 
-        # Load file entries
+        # Load file entries (ManifestEntry.from_dict(), inlined for the
+        # per-file loop: positional construction, no classmethod call)
         files_data = data.get("files", {})
+        entries = manifest.entries
         for relative_path, entry_data in files_data.items():
-            manifest.entries[relative_path] = ManifestEntry.from_dict(relative_path, entry_data)
+            get = entry_data.get
+            entries[relative_path] = ManifestEntry(
+                relative_path,
+                get("hash", ""),
+                get("size", 0),
+                get("mtime", 0.0),
+                get("permissions", 0o644),
+                float(get("backed_up_at", 0)),
+            )
 
         return manifest
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ManifestDiff:
     """
     Result of comparing source files against a manifest.
@@ -317,29 +349,38 @@ class ManifestManager(ABC):
             result.new_files = list(source_files.values())
             return result
 
-        # Track which manifest entries we've seen
-        seen_paths: set = set()
+        # Entries left over after matching every source file were deleted;
+        # the copy keeps manifest order for deleted_paths
+        unmatched = dict(manifest.entries)
+        take_entry = unmatched.pop
+        new_files = result.new_files
+        modified_files = result.modified_files
+        unchanged_files = result.unchanged_files
 
         for file_info in source_files.values():
-            relative_path = str(file_info.relative_path)
-            seen_paths.add(relative_path)
-
-            entry = manifest.get_entry(relative_path)
+            entry = take_entry(str(file_info.relative_path), None)
 
             if entry is None:
                 # New file
-                result.new_files.append(file_info)
-            elif entry.has_changed(file_info):
+                new_files.append(file_info)
+            elif (
+                # ManifestEntry.has_changed(), inlined for the per-file loop
+                entry.size != file_info.size
+                or entry.mtime != file_info.mtime
+                or (
+                    file_info.file_hash
+                    and entry.file_hash
+                    and file_info.file_hash != entry.file_hash
+                )
+            ):
                 # Modified file
-                result.modified_files.append(file_info)
+                modified_files.append(file_info)
             else:
                 # Unchanged
-                result.unchanged_files.append(file_info)
+                unchanged_files.append(file_info)
 
         # Find deleted files (in manifest but not in source)
-        for relative_path in manifest.entries:
-            if relative_path not in seen_paths:
-                result.deleted_paths.append(relative_path)
+        result.deleted_paths = list(unmatched)
 
         return result
 
@@ -348,6 +389,7 @@ class ManifestManager(ABC):
         manifest: Manifest,
         backed_up_files: List[FileInfo],
         deleted_paths: Optional[List[str]] = None,
+        hash_algorithm: str = "sha256",
     ) -> Manifest:
         """
         Update manifest after a backup operation.
@@ -356,42 +398,54 @@ class ManifestManager(ABC):
             manifest: The manifest to update
             backed_up_files: Files that were backed up
             deleted_paths: Paths that were deleted from backup
+            hash_algorithm: Algorithm of the backed up files' hashes
 
         Returns:
             Updated manifest
         """
-        backup_time = datetime.now().timestamp()
-
-        # Add/update entries for backed up files
+        now = datetime.now()
+        backup_time = now.timestamp()
+        entries = manifest.entries
+
+        if manifest.hash_algorithm != hash_algorithm:
+            # Digests of the old algorithm (e.g. MD5 in pre-0.5 manifests)
+            # cannot be checked against the new one; drop them so verify()
+            # and diff() skip those entries until they are backed up again
+            for entry in entries.values():
+                entry.file_hash = ""
+            manifest.hash_algorithm = hash_algorithm
+
+        # Add/update entries for backed up files; only these leaves change,
+        # and manifest.updated is set once below instead of per entry
         for file_info in backed_up_files:
             entry = ManifestEntry.from_file_info(file_info, backed_up_at=backup_time)
-            manifest.add_entry(entry)
+            entries[entry.relative_path] = entry
 
         # Remove entries for deleted files
         if deleted_paths:
             for path in deleted_paths:
-                manifest.remove_entry(path)
+                entries.pop(path, None)
 
         # Update metadata
         manifest.backup_count += 1
-        manifest.updated = datetime.now()
+        manifest.updated = now
 
         return manifest
 
     @staticmethod
-    def _hash_file(path: Path, chunk_size: int = 65536) -> str:
-        """Calculate SHA-256 hash of a file for verification."""
-        hasher = hashlib.sha256()
+    def _hash_file(path: Path, algorithm: str = "sha256") -> str:
+        """Calculate the hash of a file for verification ("" if unreadable)."""
         try:
-            with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            return hash_file(path, algorithm)
         except Exception:
             return ""
 
     def verify(
-        self, manifest: Manifest, backup_target: Path, verify_hashes: bool = False
+        self,
+        manifest: Manifest,
+        backup_target: Path,
+        verify_hashes: bool = False,
+        max_workers: int = 4,
     ) -> List[str]:
         """
         Verify backup files against manifest.
@@ -400,29 +454,47 @@ class ManifestManager(ABC):
             manifest: The manifest to verify against
             backup_target: Path to the backup directory
             verify_hashes: If True, re-hash files and compare against stored hashes
+                (using the manifest's hash_algorithm)
+            max_workers: Threads used to stat files (on large manifests) and
+                to hash them when verify_hashes is set
 
         Returns:
-            List of verification errors (empty if all files match)
+            List of verification errors (empty if all files match); hash
+            mismatches are listed after missing files and size mismatches
         """
         errors = []
+        to_hash: List[ManifestEntry] = []
+
+        entries = list(manifest.iter_entries())
+        paths = [backup_target / entry.relative_path for entry in entries]
 
-        for entry in manifest.iter_entries():
-            file_path = backup_target / entry.relative_path
+        stats = parallel_map(_stat_path, paths, max_workers)
 
-            if not file_path.exists():
+        for entry, stat in zip(entries, stats):
+            if isinstance(stat, FileNotFoundError):
                 errors.append(f"Missing: {entry.relative_path}")
                 continue
+            if isinstance(stat, OSError):
+                errors.append(f"Error reading {entry.relative_path}: {stat}")
+                continue
 
-            try:
-                stat = file_path.stat()
-
-                if stat.st_size != entry.size:
-                    errors.append(
-                        f"Size mismatch: {entry.relative_path} "
-                        f"(expected {entry.size}, got {stat.st_size})"
-                    )
-                elif verify_hashes and entry.file_hash:
-                    actual_hash = self._hash_file(file_path)
+            if stat.st_size != entry.size:
+                errors.append(
+                    f"Size mismatch: {entry.relative_path} "
+                    f"(expected {entry.size}, got {stat.st_size})"
+                )
+            elif verify_hashes and entry.file_hash:
+                to_hash.append(entry)
+
+        if to_hash:
+            algorithm = manifest.hash_algorithm
+
+            def hash_entry(entry: ManifestEntry) -> str:
+                return self._hash_file(backup_target / entry.relative_path, algorithm)
+
+            # hashlib releases the GIL while digesting, so files hash in parallel
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                for entry, actual_hash in zip(to_hash, executor.map(hash_entry, to_hash)):
                     if actual_hash and actual_hash != entry.file_hash:
                         errors.append(
                             f"Hash mismatch: {entry.relative_path} "
@@ -430,7 +502,4 @@ class ManifestManager(ABC):
                             f"got {actual_hash[:16]}...)"
                         )
 
-            except OSError as e:
-                errors.append(f"Error reading {entry.relative_path}: {e}")
-
         return errors
@@ -2,12 +2,18 @@
 Models - Data classes for SmartBackup.
 """
 
+import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+# ``@dataclass(slots=True)`` is only available on Python 3.10+; on older
+# interpreters the classes fall back to a regular ``__dict__``.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class FileAction(Enum):
     """Actions that can be applied to files."""
@@ -19,15 +25,37 @@ class FileAction(Enum):
     ERROR = auto()
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FileInfo:
-    """Information about a single file."""
+    """
+    Information about a single file.
+
+    Immutable: the same instance is shared between the scan result, the
+    change lists, the backup result and the manifest update.
+    """
 
     path: Path
     relative_path: Path
     size: int
     mtime: float
     file_hash: Optional[str] = None
+    # st_mode from the scan, so the manifest needn't stat the file again
+    mode: Optional[int] = None
+
+    @classmethod
+    def from_direntry(
+        cls, entry: os.DirEntry, relative_path: Path, file_hash: Optional[str] = None
+    ) -> "FileInfo":
+        """Creates a FileInfo from an os.scandir() entry, reusing its cached stat."""
+        stat = entry.stat(follow_symlinks=False)
+        return cls(
+            path=Path(entry.path),
+            relative_path=relative_path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            file_hash=file_hash,
+            mode=stat.st_mode,
+        )
 
     def needs_update(self, other: "FileInfo", use_hash: bool = False) -> bool:
         """Checks if the file needs to be updated."""
@@ -40,7 +68,7 @@ class FileInfo:
         return False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BackupResult:
     """Result of a backup operation."""
 
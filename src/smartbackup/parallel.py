@@ -0,0 +1,39 @@
+"""
+Parallel - Thread pool for per-file I/O shared by the scanner, detector and manifest.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default number of threads that stat (or hash) files; each call mostly
+# waits on the drive or network, so far more threads than CPUs pay off
+DEFAULT_STAT_WORKERS = 32
+
+# Below this many files the work runs serially; a pool costs more
+STAT_PARALLEL_THRESHOLD = 256
+
+
+def stat_workers_from_env() -> int:
+    """Returns the worker count from SMARTBACKUP_STAT_THREADS, if valid."""
+    try:
+        workers = int(os.environ.get("SMARTBACKUP_STAT_THREADS", DEFAULT_STAT_WORKERS))
+    except ValueError:
+        return DEFAULT_STAT_WORKERS
+    return max(1, workers)
+
+
+def parallel_map(func: Callable[[T], R], items: Sequence[T], max_workers: int) -> List[R]:
+    """
+    Applies func to every item, returning the results in input order.
+
+    Uses up to max_workers threads once there are STAT_PARALLEL_THRESHOLD
+    items; smaller batches (or max_workers <= 1) run serially.
+    """
+    if max_workers <= 1 or len(items) < STAT_PARALLEL_THRESHOLD:
+        return list(map(func, items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
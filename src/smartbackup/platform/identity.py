@@ -5,17 +5,40 @@ Provides functions to identify the current device using the system hostname,
 enabling per-device backup separation on shared external drives.
 """
 
+import functools
 import platform
-import re
+from typing import Dict
 
 
+class _SanitizeTable(Dict[int, str]):
+    """
+    str.translate() table mapping characters that are not alphanumeric,
+    "-" or "_" to "-".
+
+    Entries are filled in (and kept) on first lookup, so any Unicode
+    character is handled without precomputing the whole code space.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        result = char if char.isalnum() or char in "-_" else "-"
+        self[codepoint] = result
+        return result
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
+@functools.lru_cache(maxsize=1)
 def get_device_name() -> str:
     """
     Get a filesystem-safe identifier for the current device.
 
     Uses the system hostname via platform.node(), sanitized for safe use
     as a directory name. On macOS, the ".local" suffix appended by
-    mDNS/Bonjour is stripped automatically.
+    mDNS/Bonjour is stripped automatically. The result is cached for the
+    lifetime of the process; call get_device_name.cache_clear() to re-read
+    the hostname.
 
     Returns:
         A sanitized hostname string (e.g., "Musabs-MacBook-Pro")
@@ -28,9 +51,9 @@ def get_device_name() -> str:
     hostname = hostname.split(".")[0]
 
     # Replace non-alphanumeric/non-hyphen/non-underscore chars with hyphens
-    sanitized = re.sub(r"[^\w\-]", "-", hostname)
+    sanitized = hostname.translate(_SANITIZE_TABLE)
 
     # Collapse runs of hyphens, strip leading/trailing
-    sanitized = re.sub(r"-+", "-", sanitized).strip("-")
+    sanitized = "-".join(filter(None, sanitized.split("-")))
 
     return sanitized or "unknown-device"
@@ -2,11 +2,17 @@
 PathResolver - Cross-platform path resolution.
 """
 
+import functools
 import os
 import platform
 import shutil
+import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+# Seconds a find_external_drives() result is reused; drives can be plugged
+# in or removed at any time, so it is only cached briefly
+DRIVE_CACHE_TTL = 5.0
 
 
 class PathResolver:
@@ -19,9 +25,18 @@ class PathResolver:
     - Different drives (Windows) / mount points (Unix)
     """
 
+    # (time.monotonic() of the scan, drives) of the last find_external_drives()
+    _drive_cache: Optional[Tuple[float, List[Tuple[Path, str, int]]]] = None
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_documents_path() -> Path:
-        """Determines the Documents folder in a platform-independent way."""
+        """
+        Determines the Documents folder in a platform-independent way.
+
+        The result is cached for the process lifetime; call
+        PathResolver.get_documents_path.cache_clear() to look it up again.
+        """
         system = platform.system()
 
         if system == "Windows":
@@ -73,13 +88,22 @@ class PathResolver:
             return Path.home() / "Documents"
 
     @staticmethod
-    def find_external_drives() -> List[Tuple[Path, str, int]]:
+    def find_external_drives(max_age: float = DRIVE_CACHE_TTL) -> List[Tuple[Path, str, int]]:
         """
         Finds all external storage media.
 
+        Args:
+            max_age: Reuse the previous result if it is at most this many
+                seconds old; 0 always rescans
+
         Returns:
             List of tuples (path, label, free space in bytes)
         """
+        now = time.monotonic()
+        cached = PathResolver._drive_cache
+        if cached is not None and now - cached[0] < max_age:
+            return list(cached[1])
+
         drives: List[Tuple[Path, str, int]] = []
         system = platform.system()
 
@@ -90,6 +114,7 @@ class PathResolver:
         else:
             drives = PathResolver._find_linux_drives()
 
+        PathResolver._drive_cache = (now, list(drives))
         return drives
 
     @staticmethod
@@ -25,25 +25,54 @@ _smartbackup_theme = Theme(
 console = Console(theme=_smartbackup_theme, highlight=False)
 
 
+# ANSI escape code for each Colors attribute
+_ANSI_CODES = {
+    "HEADER": "\033[95m",
+    "BLUE": "\033[94m",
+    "CYAN": "\033[96m",
+    "GREEN": "\033[92m",
+    "YELLOW": "\033[93m",
+    "RED": "\033[91m",
+    "BOLD": "\033[1m",
+    "UNDERLINE": "\033[4m",
+    "END": "\033[0m",
+}
+
+
 class Colors:
     """ANSI Color Codes for Terminal Output (Cross-Platform).
 
     Retained for backward compatibility.  New code should prefer the module-level
     ``console`` (a ``rich.console.Console`` instance) instead.
+
+    The codes stay plain class attributes so reading them costs nothing;
+    disable() and enable() rewrite them all from ``_ANSI_CODES``.
     """
 
-    HEADER = "\033[95m"
-    BLUE = "\033[94m"
-    CYAN = "\033[96m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    RED = "\033[91m"
-    BOLD = "\033[1m"
-    UNDERLINE = "\033[4m"
-    END = "\033[0m"
+    HEADER = _ANSI_CODES["HEADER"]
+    BLUE = _ANSI_CODES["BLUE"]
+    CYAN = _ANSI_CODES["CYAN"]
+    GREEN = _ANSI_CODES["GREEN"]
+    YELLOW = _ANSI_CODES["YELLOW"]
+    RED = _ANSI_CODES["RED"]
+    BOLD = _ANSI_CODES["BOLD"]
+    UNDERLINE = _ANSI_CODES["UNDERLINE"]
+    END = _ANSI_CODES["END"]
+
+    _enabled = True
 
     @classmethod
     def disable(cls) -> None:
         """Disables colors for unsupported terminals."""
-        cls.HEADER = cls.BLUE = cls.CYAN = cls.GREEN = ""
-        cls.YELLOW = cls.RED = cls.BOLD = cls.UNDERLINE = cls.END = ""
+        if cls._enabled:
+            for name in _ANSI_CODES:
+                setattr(cls, name, "")
+            cls._enabled = False
+
+    @classmethod
+    def enable(cls) -> None:
+        """Restores the color codes after disable()."""
+        if not cls._enabled:
+            for name, code in _ANSI_CODES.items():
+                setattr(cls, name, code)
+            cls._enabled = True
@@ -5,12 +5,14 @@ Modernised with Rich for styled terminal output, progress bars, panels,
 and tables while keeping the same public API.
 """
 
+import os
 import platform
 import sys
 import threading
-from datetime import datetime
+import time
+import weakref
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
@@ -28,6 +30,44 @@ from rich.text import Text
 
 from smartbackup.models import BackupResult, FileAction
 
+# Minimum seconds between two progress bar updates (10 Hz)
+PROGRESS_INTERVAL = 0.1
+
+# Units for _format_size(), one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Most buffers one writev() call accepts (POSIX guarantees at least 16)
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+
+# O_BINARY keeps Windows from translating newlines in the raw descriptor
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+
+def _write_all(fd: int, chunks: List[bytes]) -> None:
+    """Writes all chunks to fd, gathering them into as few syscalls as possible."""
+    if hasattr(os, "writev"):
+        for start in range(0, len(chunks), _IOV_MAX):
+            batch = chunks[start : start + _IOV_MAX]
+            written = os.writev(fd, batch)
+            if written < sum(map(len, batch)):
+                # Short write: finish this batch with plain writes
+                _write_all_plain(fd, b"".join(batch)[written:])
+    else:
+        _write_all_plain(fd, b"".join(chunks))
+
+
+def _write_all_plain(fd: int, data: bytes) -> None:
+    """Writes data to fd, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
 
 class BackupLogger:
     """
@@ -44,18 +84,32 @@ class BackupLogger:
         self.log_file = log_file
         self.verbose = verbose
         self.lock = threading.Lock()
-        self._log_buffer: List[str] = []
+        # Encoded log lines (newline included) waiting for flush_to_file()
+        self._log_buffer: List[bytes] = []
+        # Append-mode descriptor for log_file, kept open across flushes
+        self._log_fd: Optional[int] = None
+        self._log_fd_path: Optional[Path] = None
+        self._log_fd_finalizer: Optional[weakref.finalize] = None
         self._progress_line_active = False
         self.console = Console(highlight=False)
+        # (epoch second, formatted) of the last _timestamp() call
+        self._timestamp_cache: Tuple[int, str] = (-1, "")
 
         # Rich progress bar (lazily initialised)
         self._progress_bar: Optional[Progress] = None
         self._progress_task_id: Optional[int] = None
         self._progress_total: int = 0
+        # time.monotonic() of the last progress bar update
+        self._last_progress_ts = 0.0
 
     def _timestamp(self) -> str:
-        """Formatted timestamp."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Formatted timestamp, reformatted at most once per second."""
+        second = int(time.time())
+        cached = self._timestamp_cache
+        if cached[0] != second:
+            cached = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+            self._timestamp_cache = cached
+        return cached[1]
 
     def _stop_progress(self) -> None:
         """Stop the Rich progress bar if it is running."""
@@ -146,10 +200,24 @@ class BackupLogger:
         bytes_copied: int = 0,
         total_bytes: int = 0,
     ) -> None:
-        """Shows a progress bar using Rich Progress."""
+        """
+        Shows a progress bar using Rich Progress.
+
+        Updates are throttled to PROGRESS_INTERVAL; the first and the final
+        update (current == total) are always shown.
+        """
         if total == 0:
             return
 
+        now = time.monotonic()
+        if (
+            self._progress_bar is not None
+            and current < total
+            and now - self._last_progress_ts < PROGRESS_INTERVAL
+        ):
+            return
+        self._last_progress_ts = now
+
         # Truncate filename
         if len(current_file) > 40:
             current_file = "..." + current_file[-37:]
@@ -190,27 +258,53 @@ class BackupLogger:
 
     def _format_size(self, size: int) -> str:
         """Formats file size in human-readable format."""
-        size_float = float(size)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_float < 1024:
-                return f"{size_float:.1f}{unit}"
-            size_float /= 1024
-        return f"{size_float:.1f}PB"
+        if size < 1024:
+            return f"{size:.1f}B"
+        # Each unit is 10 more bits, so the bit length picks the unit directly
+        index = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (10 * index)):.1f}{_SIZE_UNITS[index]}"
 
     def _log_to_file(self, message: str) -> None:
         """Writes to the log file."""
         if self.log_file:
+            line = (message + "\n").encode("utf-8")
             with self.lock:
-                self._log_buffer.append(message)
+                self._log_buffer.append(line)
+
+    def _open_log_fd(self) -> int:
+        """Returns the descriptor for log_file, reopening it if the path changed."""
+        if self._log_fd is not None and self._log_fd_path == self.log_file:
+            return self._log_fd
+
+        self._close_log_fd()
+        fd = os.open(self.log_file, _LOG_OPEN_FLAGS, 0o644)
+        self._log_fd = fd
+        self._log_fd_path = self.log_file
+        # Closes the descriptor if the logger is collected without close()
+        self._log_fd_finalizer = weakref.finalize(self, os.close, fd)
+        return fd
+
+    def _close_log_fd(self) -> None:
+        """Closes the cached log file descriptor, if any."""
+        if self._log_fd_finalizer is not None:
+            self._log_fd_finalizer()
+        self._log_fd = None
+        self._log_fd_path = None
+        self._log_fd_finalizer = None
 
     def flush_to_file(self) -> None:
-        """Writes the buffer to the log file."""
+        """Writes the buffer to the log file with a single gathered write."""
         if self.log_file and self._log_buffer:
             with self.lock:
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write("\n".join(self._log_buffer) + "\n")
+                _write_all(self._open_log_fd(), self._log_buffer)
                 self._log_buffer.clear()
 
+    def close(self) -> None:
+        """Flushes pending log lines and closes the log file."""
+        self.flush_to_file()
+        with self.lock:
+            self._close_log_fd()
+
     def summary(self, result: BackupResult) -> None:
         """Shows a summary of the backup operation using a Rich table."""
         self._clear_progress_line()
@@ -2,9 +2,10 @@
 Shared test fixtures for SmartBackup tests.
 """
 
+import os
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Dict, Generator
 
 import pytest
 
@@ -42,6 +43,21 @@ def backup_dir(temp_dir: Path) -> Path:
     return backup
 
 
+@pytest.fixture
+def backup_stat_cache(backup_dir: Path) -> Callable[[], Dict[str, os.stat_result]]:
+    """Return a function that stats the top level of backup_dir in one scandir pass.
+
+    Call it after creating the backup files; the result is keyed by str path,
+    as ChangeDetector.detect_changes(stat_cache=...) expects.
+    """
+
+    def build() -> Dict[str, os.stat_result]:
+        with os.scandir(backup_dir) as it:
+            return {entry.path: entry.stat(follow_symlinks=False) for entry in it}
+
+    return build
+
+
 @pytest.fixture
 def source_with_exclusions(source_dir: Path) -> Path:
     """Create a source directory with files that should be excluded."""
@@ -2,7 +2,10 @@
 Tests for the compressor module.
 """
 
+import os
+import shutil
 import tarfile
+import time
 import zipfile
 from pathlib import Path
 from unittest.mock import patch
@@ -20,22 +23,22 @@ from smartbackup.ui.logger import BackupLogger
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def logger() -> BackupLogger:
-    """Create a quiet logger for testing."""
+    """Create a quiet logger for testing (shared, never written to a file)."""
     return BackupLogger(verbose=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def compressor(logger: BackupLogger) -> BackupCompressor:
-    """Create a BackupCompressor instance."""
+    """Create a BackupCompressor instance (stateless, shared across tests)."""
     return BackupCompressor(logger)
 
 
-@pytest.fixture
-def sample_backup_dir(temp_dir: Path) -> Path:
-    """Create a sample backup directory with files to compress."""
-    backup = temp_dir / "sample_backup"
+@pytest.fixture(scope="module")
+def sample_backup_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the sample backup tree once per module."""
+    backup = tmp_path_factory.mktemp("templates") / "sample_backup"
     backup.mkdir()
 
     # Create some files
@@ -55,10 +58,10 @@ def sample_backup_dir(temp_dir: Path) -> Path:
     return backup
 
 
-@pytest.fixture
-def sample_backup_root(temp_dir: Path) -> Path:
-    """Create a Documents-Backup/ root with a device subfolder."""
-    root = temp_dir / "Documents-Backup"
+@pytest.fixture(scope="module")
+def sample_backup_root_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the Documents-Backup/ tree once per module."""
+    root = tmp_path_factory.mktemp("templates") / "Documents-Backup"
     root.mkdir()
 
     device = root / "TestDevice"
@@ -69,6 +72,26 @@ def sample_backup_root(temp_dir: Path) -> Path:
     return root
 
 
+@pytest.fixture(scope="module")
+def large_file_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write 1.5 MB of repetitive data once per module."""
+    large_file = tmp_path_factory.mktemp("templates") / "large.bin"
+    large_file.write_bytes(b"A" * (1024 * 1024 + 512 * 1024))
+    return large_file
+
+
+@pytest.fixture
+def sample_backup_dir(temp_dir: Path, sample_backup_template: Path) -> Path:
+    """Create a sample backup directory with files to compress."""
+    return Path(shutil.copytree(sample_backup_template, temp_dir / "sample_backup"))
+
+
+@pytest.fixture
+def sample_backup_root(temp_dir: Path, sample_backup_root_template: Path) -> Path:
+    """Create a Documents-Backup/ root with a device subfolder."""
+    return Path(shutil.copytree(sample_backup_root_template, temp_dir / "Documents-Backup"))
+
+
 # ---------------------------------------------------------------------------
 # TestBackupCompressor - Format validation
 # ---------------------------------------------------------------------------
@@ -160,6 +183,23 @@ class TestZipCompression:
             has_subdir = any("subdir/" in n for n in names)
             assert has_subdir
 
+    def test_compress_zip_arcnames_are_relative_posix_paths(
+        self, compressor: BackupCompressor, sample_backup_dir: Path, temp_dir: Path
+    ):
+        """Member names are relative to the source and use forward slashes."""
+        output = temp_dir / "backup.zip"
+        compressor.compress(sample_backup_dir, output, "zip")
+
+        with zipfile.ZipFile(output, "r") as zf:
+            assert sorted(zf.namelist()) == [
+                "file1.txt",
+                "file2.py",
+                "subdir/",
+                "subdir/deep/",
+                "subdir/deep/deep_file.txt",
+                "subdir/nested.txt",
+            ]
+
     def test_compress_zip_content_matches(
         self, compressor: BackupCompressor, sample_backup_dir: Path, temp_dir: Path
     ):
@@ -171,6 +211,109 @@ class TestZipCompression:
             assert zf.read("file1.txt").decode() == "Hello World"
             assert zf.read("file2.py").decode() == "print('test')"
 
+    def test_compress_zip_stores_tiny_files(
+        self, compressor: BackupCompressor, sample_backup_dir: Path, temp_dir: Path
+    ):
+        """Files below the store threshold are stored, larger ones deflated."""
+        (sample_backup_dir / "big.txt").write_text("x" * 4096)
+        output = temp_dir / "stored.zip"
+        compressor.compress(sample_backup_dir, output, "zip")
+
+        with zipfile.ZipFile(output, "r") as zf:
+            small = zf.getinfo("file1.txt")
+            big = zf.getinfo("big.txt")
+            assert small.compress_type == zipfile.ZIP_STORED
+            assert big.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read("file1.txt") == b"Hello World"
+            assert zf.testzip() is None
+
+
+# ---------------------------------------------------------------------------
+# TestBackupCompressor - Parallel zip writer
+# ---------------------------------------------------------------------------
+
+
+class TestParallelZipCompression:
+    """Tests for the multi-threaded zip writer."""
+
+    @pytest.fixture
+    def parallel_compressor(self, logger: BackupLogger) -> BackupCompressor:
+        return BackupCompressor(logger, max_workers=4)
+
+    @pytest.fixture
+    def mixed_source(self, sample_backup_dir: Path) -> Path:
+        """Add compressible, empty, non-ASCII and empty-dir members to the sample."""
+        (sample_backup_dir / "big.txt").write_text("lorem ipsum " * 2000)
+        (sample_backup_dir / "empty.txt").write_bytes(b"")
+        (sample_backup_dir / "sübdir").mkdir()
+        (sample_backup_dir / "sübdir" / "ñame.txt").write_text("unicode " * 100)
+        (sample_backup_dir / "empty_dir").mkdir()
+        return sample_backup_dir
+
+    def test_parallel_zip_matches_serial(
+        self,
+        compressor: BackupCompressor,
+        parallel_compressor: BackupCompressor,
+        mixed_source: Path,
+        temp_dir: Path,
+    ):
+        """The parallel writer produces the same members as zipfile."""
+        serial = compressor.compress(mixed_source, temp_dir / "serial.zip", "zip")
+        parallel = parallel_compressor.compress(
+            mixed_source, temp_dir / "parallel.zip", "zip"
+        )
+
+        with zipfile.ZipFile(serial) as zs, zipfile.ZipFile(parallel) as zp:
+            assert zp.testzip() is None
+            assert zp.namelist() == zs.namelist()
+            for expected, actual in zip(zs.infolist(), zp.infolist()):
+                assert actual.compress_type == expected.compress_type
+                assert actual.CRC == expected.CRC
+                assert actual.file_size == expected.file_size
+                assert actual.date_time == expected.date_time
+                assert actual.external_attr == expected.external_attr
+                assert zp.read(actual) == zs.read(expected)
+
+    def test_parallel_zip_streams_large_files(
+        self,
+        parallel_compressor: BackupCompressor,
+        mixed_source: Path,
+        temp_dir: Path,
+    ):
+        """Files above the stream threshold are written correctly."""
+        data = bytes(range(256)) * 64
+        (mixed_source / "streamed.bin").write_bytes(data)
+
+        with patch("smartbackup.core.compressor.ZIP_STREAM_THRESHOLD", 4096), patch(
+            "smartbackup.core.compressor.ZIP_CHUNK_SIZE", 1000
+        ):
+            output = parallel_compressor.compress(mixed_source, temp_dir / "s.zip", "zip")
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.read("streamed.bin") == data
+            assert zf.read("big.txt").decode() == "lorem ipsum " * 2000
+
+    def test_parallel_zip_falls_back_to_zipfile(
+        self,
+        parallel_compressor: BackupCompressor,
+        sample_backup_dir: Path,
+        temp_dir: Path,
+    ):
+        """Archives that would need zip64 records are written by zipfile."""
+        with patch(
+            "smartbackup.core.compressor._fits_without_zip64", return_value=False
+        ), patch.object(
+            BackupCompressor, "_write_zip_parallel"
+        ) as parallel_writer:
+            output = parallel_compressor.compress(
+                sample_backup_dir, temp_dir / "fallback.zip", "zip"
+            )
+
+        parallel_writer.assert_not_called()
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("file1.txt") == b"Hello World"
+
 
 # ---------------------------------------------------------------------------
 # TestBackupCompressor - TAR.GZ compression
@@ -274,6 +417,13 @@ class TestArchiveNaming:
         assert parts[1].isdigit()
         assert parts[2].isdigit()
 
+    def test_get_archive_name_zero_pads_timestamp(self):
+        """Single-digit date and time fields are zero-padded."""
+        fixed = time.struct_time((2026, 3, 4, 5, 6, 7, 2, 63, 0))
+        with patch("smartbackup.core.compressor.time.localtime", return_value=fixed):
+            name = BackupCompressor.get_archive_name("Dev", "zip")
+        assert name == "Dev_20260304_050607.zip"
+
 
 # ---------------------------------------------------------------------------
 # TestBackupCompressor - Already compressed detection
@@ -374,14 +524,12 @@ class TestCompressionEdgeCases:
             assert len([m for m in tf.getmembers() if m.isfile()]) == 0
 
     def test_compress_large_file(
-        self, compressor: BackupCompressor, temp_dir: Path
+        self, compressor: BackupCompressor, large_file_template: Path, temp_dir: Path
     ):
         """A single large file (>1MB) compresses successfully."""
         source = temp_dir / "large_source"
         source.mkdir()
-        large_file = source / "large.bin"
-        # Write 1.5 MB of data
-        large_file.write_bytes(b"A" * (1024 * 1024 + 512 * 1024))
+        large_file = Path(shutil.copy(large_file_template, source / "large.bin"))
 
         output = temp_dir / "large.zip"
         result = compressor.compress(source, output, "zip")
@@ -427,6 +575,21 @@ class TestCompressionEdgeCases:
             assert "file with spaces.txt" in names
             assert "file-with-dashes.txt" in names
 
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available"
+    )
+    def test_compress_drops_archive_from_page_cache(
+        self, compressor: BackupCompressor, sample_backup_dir: Path, temp_dir: Path
+    ):
+        """The finished archive is hinted with POSIX_FADV_DONTNEED."""
+        output = temp_dir / "hinted.zip"
+        with patch("smartbackup.core.compressor.os.posix_fadvise") as fadvise:
+            compressor.compress(sample_backup_dir, output, "zip")
+
+        advice = [call.args[3] for call in fadvise.call_args_list]
+        assert os.POSIX_FADV_DONTNEED in advice
+        assert zipfile.is_zipfile(output)
+
     def test_compress_atomic_no_partial_on_failure(
         self, compressor: BackupCompressor, temp_dir: Path
     ):
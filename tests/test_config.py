@@ -2,8 +2,11 @@
 Tests for the config module.
 """
 
+import dataclasses
+import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -79,15 +82,32 @@ class TestBackupConfig:
         assert config.device_name == "Work-Laptop"
 
     def test_exclusions_are_copied(self, temp_dir: Path):
-        """Default exclusions should be a copy, not the original set."""
+        """Extending a config's exclusions should not modify the defaults."""
         config = BackupConfig(source_path=temp_dir, backup_path=temp_dir)
 
-        # Modify config exclusions
-        config.exclusions.add("test_exclusion")
+        # Derive a config with an extra exclusion
+        config = dataclasses.replace(
+            config, exclusions=config.exclusions | {"test_exclusion"}
+        )
 
+        assert "test_exclusion" in config.exclusions
         # Original should not be modified
         assert "test_exclusion" not in DEFAULT_EXCLUSIONS
 
+    def test_config_is_frozen(self, temp_dir: Path):
+        """Config fields should not be reassignable after creation."""
+        config = BackupConfig(source_path=temp_dir, backup_path=temp_dir)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_workers = 16  # type: ignore[misc]
+
+    def test_default_exclusions_shared(self, temp_dir: Path):
+        """Default configs should share the module-level frozensets."""
+        config = BackupConfig(source_path=temp_dir, backup_path=temp_dir)
+
+        assert config.exclusions is DEFAULT_EXCLUSIONS
+        assert config.excluded_extensions is EXCLUDED_EXTENSIONS
+
     def test_custom_exclusions(self, temp_dir: Path):
         """Custom exclusions should be accepted."""
         custom = {"my_folder", "other_folder"}
@@ -100,6 +120,29 @@ class TestBackupConfig:
         assert "my_folder" in config.exclusions
         assert "other_folder" in config.exclusions
         assert "node_modules" not in config.exclusions
+        assert isinstance(config.exclusions, frozenset)
+
+    def test_is_excluded_directories_and_extensions(self, temp_dir: Path):
+        """is_excluded should filter both excluded folders and extensions."""
+        config = BackupConfig(source_path=temp_dir, backup_path=temp_dir)
+
+        assert config.is_excluded("node_modules") is True
+        assert config.is_excluded("module.pyc") is True
+        assert config.is_excluded("debug.LOG") is True
+        assert config.is_excluded("main.py") is False
+        assert config.is_excluded("src") is False
+
+    def test_is_excluded_uses_custom_exclusions(self, temp_dir: Path):
+        """is_excluded should follow the config's own exclusion set."""
+        config = BackupConfig(
+            source_path=temp_dir,
+            backup_path=temp_dir,
+            exclusions={"my_folder", "*.draft"},
+        )
+
+        assert config.is_excluded("my_folder") is True
+        assert config.is_excluded("notes.draft") is True
+        assert config.is_excluded("node_modules") is False
 
     def test_custom_workers(self, temp_dir: Path):
         """Custom worker count should be accepted."""
@@ -146,6 +189,43 @@ class TestConfigManager:
             assert loaded["key"] == "value"
             assert loaded["number"] == 42
 
+    def test_save_is_atomic(self):
+        """Saving should not leave a temp file behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ConfigManager()
+            manager.config_dir = Path(tmpdir)
+            manager.config_file = Path(tmpdir) / "config.json"
+
+            manager.save({"key": "value"})
+
+            assert manager.config_file.exists()
+            assert not manager.config_file.with_suffix(".json.tmp").exists()
+
+    def test_load_picks_up_external_changes(self):
+        """A cached config should be re-read after the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ConfigManager()
+            manager.config_dir = Path(tmpdir)
+            manager.config_file = Path(tmpdir) / "config.json"
+
+            manager.save({"key": "value"})
+            assert manager.load()["key"] == "value"
+
+            manager.config_file.write_text('{"key": "changed value"}', encoding="utf-8")
+            assert manager.load()["key"] == "changed value"
+
+    def test_load_returns_independent_copies(self):
+        """Mutating a loaded config should not affect later loads."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ConfigManager()
+            manager.config_dir = Path(tmpdir)
+            manager.config_file = Path(tmpdir) / "config.json"
+
+            manager.save({"exclusions": ["a"]})
+            manager.load()["exclusions"].append("b")
+
+            assert manager.load()["exclusions"] == ["a"]
+
     def test_add_exclusion(self):
         """Exclusions should be addable."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -158,6 +238,69 @@ class TestConfigManager:
             config = manager.load()
             assert "my_pattern" in config.get("exclusions", [])
 
+    def test_add_exclusion_appends_to_journal(self):
+        """add_exclusion should append to the journal without rewriting the config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ConfigManager()
+            manager.config_dir = Path(tmpdir)
+            manager.config_file = Path(tmpdir) / "config.json"
+
+            manager.save({"exclusions": ["a"], "device_name": "Laptop"})
+            before = manager.config_file.read_text(encoding="utf-8")
+
+            for pattern in ("b", "c", "a", "b"):
+                manager.add_exclusion(pattern)
+
+            assert manager.config_file.read_text(encoding="utf-8") == before
+            assert len(manager.exclusions_journal.read_text().splitlines()) == 4
+            config = manager.load()
+            assert config["exclusions"] == ["a", "b", "c"]
+            assert config["device_name"] == "Laptop"
+
+    def test_save_folds_in_exclusion_journal(self):
+        """Saving a loaded config should persist journaled exclusions."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ConfigManager()
+            manager.config_dir = Path(tmpdir)
+            manager.config_file = Path(tmpdir) / "config.json"
+
+            manager.add_exclusion("my_pattern")
+            manager.set_device_name("Laptop")
+
+            assert not manager.exclusions_journal.exists()
+            saved = json.loads(manager.config_file.read_text(encoding="utf-8"))
+            assert saved["exclusions"] == ["my_pattern"]
+            assert "my_pattern" in manager.get_exclusions()
+
+    def test_load_compacts_large_exclusion_journal(self):
+        """A journal over the size limit should be folded into the config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ConfigManager()
+            manager.config_dir = Path(tmpdir)
+            manager.config_file = Path(tmpdir) / "config.json"
+
+            with patch("smartbackup.config.EXCLUSION_JOURNAL_COMPACT_SIZE", 100):
+                for i in range(10):
+                    manager.add_exclusion(f"pattern_{i}")
+                config = manager.load()
+
+            assert len(config["exclusions"]) == 10
+            assert not manager.exclusions_journal.exists()
+            assert manager.load() == config
+
+    def test_load_skips_torn_journal_line(self):
+        """A partially written journal line should be ignored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ConfigManager()
+            manager.config_dir = Path(tmpdir)
+            manager.config_file = Path(tmpdir) / "config.json"
+
+            manager.add_exclusion("kept")
+            with open(manager.exclusions_journal, "a", encoding="utf-8") as f:
+                f.write('{"op": "add", "patt')
+
+            assert manager.load()["exclusions"] == ["kept"]
+
     def test_get_exclusions_includes_defaults(self):
         """get_exclusions should include default exclusions."""
         manager = ConfigManager()
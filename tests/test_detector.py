@@ -2,12 +2,16 @@
 Tests for the detector module.
 """
 
+import hashlib
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from smartbackup.core.detector import ChangeDetector
+from smartbackup.core.detector import HEAD_COMPARE_SIZE, ChangeDetector
+from smartbackup.core.hashcache import HASH_CACHE_FILENAME, HashCache
 from smartbackup.models import FileInfo
+from smartbackup.parallel import DEFAULT_STAT_WORKERS, STAT_PARALLEL_THRESHOLD
 from smartbackup.ui.logger import BackupLogger
 
 
@@ -48,7 +52,9 @@ class TestChangeDetector:
         assert len(modified_files) == 0
         assert len(deleted_files) == 0
 
-    def test_detect_modified_files(self, source_dir: Path, backup_dir: Path):
+    def test_detect_modified_files(
+        self, source_dir: Path, backup_dir: Path, backup_stat_cache
+    ):
         """Detector should identify modified files."""
         detector = ChangeDetector()
         logger = BackupLogger(verbose=False)
@@ -56,9 +62,10 @@ class TestChangeDetector:
         # Create backup file (older)
         backup_file = backup_dir / "file1.txt"
         backup_file.write_text("old content")
+        stat_cache = backup_stat_cache()
 
         # Get backup mtime
-        backup_mtime = backup_file.stat().st_mtime
+        backup_mtime = stat_cache[str(backup_file)].st_mtime
 
         # Create source file info (newer)
         source_files = {
@@ -71,14 +78,16 @@ class TestChangeDetector:
         }
 
         new_files, modified_files, deleted_files = detector.detect_changes(
-            source_files, backup_dir, logger
+            source_files, backup_dir, logger, stat_cache=stat_cache
         )
 
         assert len(new_files) == 0
         assert len(modified_files) == 1
         assert len(deleted_files) == 0
 
-    def test_detect_unchanged_files(self, source_dir: Path, backup_dir: Path):
+    def test_detect_unchanged_files(
+        self, source_dir: Path, backup_dir: Path, backup_stat_cache
+    ):
         """Detector should not flag unchanged files."""
         detector = ChangeDetector()
         logger = BackupLogger(verbose=False)
@@ -86,7 +95,8 @@ class TestChangeDetector:
         # Create backup file
         backup_file = backup_dir / "file1.txt"
         backup_file.write_text("Hello World")
-        backup_stat = backup_file.stat()
+        stat_cache = backup_stat_cache()
+        backup_stat = stat_cache[str(backup_file)]
 
         # Create source file info (same as backup)
         source_files = {
@@ -99,12 +109,43 @@ class TestChangeDetector:
         }
 
         new_files, modified_files, deleted_files = detector.detect_changes(
-            source_files, backup_dir, logger
+            source_files, backup_dir, logger, stat_cache=stat_cache
         )
 
         assert len(new_files) == 0
         assert len(modified_files) == 0
 
+    def test_detect_uses_stat_cache(
+        self, source_dir: Path, backup_dir: Path, backup_stat_cache
+    ):
+        """Cached stat results should be used instead of stat'ing again."""
+        detector = ChangeDetector()
+        logger = BackupLogger(verbose=False)
+
+        backup_file = backup_dir / "file1.txt"
+        backup_file.write_text("Hello World")
+        stat_cache = backup_stat_cache()
+        backup_stat = stat_cache[str(backup_file)]
+
+        source_files = {
+            Path("file1.txt"): FileInfo(
+                path=source_dir / "file1.txt",
+                relative_path=Path("file1.txt"),
+                size=backup_stat.st_size,
+                mtime=backup_stat.st_mtime,
+            ),
+        }
+
+        # Grow the file after caching: the cached (matching) stat wins
+        backup_file.write_text("Hello World, again")
+        _, modified_files, _ = detector.detect_changes(
+            source_files, backup_dir, logger, stat_cache=stat_cache
+        )
+        assert modified_files == []
+
+        _, modified_files, _ = detector.detect_changes(source_files, backup_dir, logger)
+        assert len(modified_files) == 1
+
     def test_detect_deleted_files(self, source_dir: Path, backup_dir: Path):
         """Detector should identify files to delete from backup."""
         detector = ChangeDetector()
@@ -126,7 +167,9 @@ class TestChangeDetector:
         assert len(deleted_files) == 1
         assert backup_dir / "orphan.txt" in deleted_files
 
-    def test_detect_mixed_changes(self, source_dir: Path, backup_dir: Path):
+    def test_detect_mixed_changes(
+        self, source_dir: Path, backup_dir: Path, backup_stat_cache
+    ):
         """Detector should handle mixed changes correctly."""
         detector = ChangeDetector()
         logger = BackupLogger(verbose=False)
@@ -134,7 +177,8 @@ class TestChangeDetector:
         # Create backup files
         (backup_dir / "existing.txt").write_text("old")
         (backup_dir / "orphan.txt").write_text("orphan")
-        existing_mtime = (backup_dir / "existing.txt").stat().st_mtime
+        stat_cache = backup_stat_cache()
+        existing_mtime = stat_cache[str(backup_dir / "existing.txt")].st_mtime
 
         # Create source file info
         source_files = {
@@ -153,7 +197,7 @@ class TestChangeDetector:
         }
 
         new_files, modified_files, deleted_files = detector.detect_changes(
-            source_files, backup_dir, logger
+            source_files, backup_dir, logger, stat_cache=stat_cache
         )
 
         assert len(new_files) == 1
@@ -192,3 +236,166 @@ class TestChangeDetector:
 
         assert len(new_files) == 1
         assert len(modified_files) == 1
+
+    def test_detect_deleted_files_in_subdirectories(
+        self, source_dir: Path, backup_dir: Path
+    ):
+        """Orphans in nested backup folders should be reported with full paths."""
+        detector = ChangeDetector()
+        logger = BackupLogger(verbose=False)
+
+        nested = backup_dir / "a" / "b"
+        nested.mkdir(parents=True)
+        (nested / "orphan.txt").write_text("orphan")
+        kept = backup_dir / "a" / "kept.txt"
+        kept.write_text("kept")
+        kept_stat = kept.stat()
+
+        source_files = {
+            Path("a/kept.txt"): FileInfo(
+                path=source_dir / "a" / "kept.txt",
+                relative_path=Path("a/kept.txt"),
+                size=kept_stat.st_size,
+                mtime=kept_stat.st_mtime,
+            ),
+        }
+
+        new_files, modified_files, deleted_files = detector.detect_changes(
+            source_files, backup_dir, logger
+        )
+
+        assert new_files == []
+        assert modified_files == []
+        assert deleted_files == [nested / "orphan.txt"]
+
+    def test_stat_workers_from_env(self, monkeypatch):
+        """SMARTBACKUP_STAT_THREADS should set the default stat worker count."""
+        monkeypatch.setenv("SMARTBACKUP_STAT_THREADS", "4")
+        assert ChangeDetector().stat_workers == 4
+        assert ChangeDetector(stat_workers=2).stat_workers == 2
+
+        monkeypatch.setenv("SMARTBACKUP_STAT_THREADS", "many")
+        assert ChangeDetector().stat_workers == DEFAULT_STAT_WORKERS
+
+    def test_parallel_stat_walk_matches_serial(self, source_dir: Path, backup_dir: Path):
+        """Threaded stats over a large backup tree should give the serial result."""
+        logger = BackupLogger(verbose=False)
+        source_files = {}
+        for i in range(STAT_PARALLEL_THRESHOLD + 20):
+            relative = Path(f"d{i % 7}") / f"f{i}.txt"
+            backup_file = backup_dir / relative
+            backup_file.parent.mkdir(exist_ok=True)
+            backup_file.write_text(str(i))
+            if i % 3:
+                stat = backup_file.stat()
+                size = stat.st_size if i % 5 else stat.st_size + 1
+                source_files[relative] = FileInfo(
+                    path=source_dir / relative,
+                    relative_path=relative,
+                    size=size,
+                    mtime=stat.st_mtime,
+                )
+
+        serial = ChangeDetector(stat_workers=1).detect_changes(source_files, backup_dir, logger)
+        parallel = ChangeDetector(stat_workers=8).detect_changes(source_files, backup_dir, logger)
+
+        assert parallel[0] == serial[0]
+        assert parallel[1] == serial[1]
+        assert sorted(parallel[2]) == sorted(serial[2])
+        assert len(serial[1]) > 0
+        assert len(serial[2]) > 0
+
+
+def _hashed_source(source_dir: Path, backup_file: Path, content: bytes) -> dict:
+    """Source files dict whose single entry matches backup_file's size and mtime."""
+    stat = backup_file.stat()
+    relative = backup_file.name
+    return {
+        Path(relative): FileInfo(
+            path=source_dir / relative,
+            relative_path=Path(relative),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            file_hash=hashlib.sha256(content).hexdigest(),
+        ),
+    }
+
+
+class TestChangeDetectorHashing:
+    """Tests for hash-based change detection and the hash cache."""
+
+    def test_detects_content_change_with_same_size_and_mtime(
+        self, source_dir: Path, backup_dir: Path
+    ):
+        """With use_hash, differing content is found even if size/mtime match."""
+        backup_file = backup_dir / "data.bin"
+        backup_file.write_bytes(b"AAAA")
+        source_files = _hashed_source(source_dir, backup_file, b"BBBB")
+
+        _, modified_files, deleted_files = ChangeDetector(use_hash=True).detect_changes(
+            source_files, backup_dir, BackupLogger(verbose=False)
+        )
+
+        assert len(modified_files) == 1
+        # The cache database is not reported as an orphaned backup file
+        assert (backup_dir / HASH_CACHE_FILENAME).exists()
+        assert deleted_files == []
+
+    def test_detector_hash_cache_hits(self, source_dir: Path, backup_dir: Path):
+        """A primed hash cache should spare re-reading unchanged backup files."""
+        content = b"unchanged content"
+        backup_file = backup_dir / "data.bin"
+        backup_file.write_bytes(content)
+        source_files = _hashed_source(source_dir, backup_file, content)
+        stat = backup_file.stat()
+
+        with HashCache(backup_dir / HASH_CACHE_FILENAME) as cache:
+            cache.put("data.bin", stat.st_size, stat.st_mtime_ns, hashlib.sha256(content).hexdigest())
+
+        with patch("smartbackup.core.hashcache.hash_file") as hash_file:
+            _, modified_files, _ = ChangeDetector(use_hash=True).detect_changes(
+                source_files, backup_dir, BackupLogger(verbose=False)
+            )
+
+        hash_file.assert_not_called()
+        assert modified_files == []
+
+    def test_head_compare_skips_full_hash(self, source_dir: Path, backup_dir: Path):
+        """Large files whose heads differ should be modified without a full hash."""
+        size = HEAD_COMPARE_SIZE * 2
+        source_content = b"A" + b"x" * (size - 1)
+        (source_dir / "big.bin").write_bytes(source_content)
+        backup_file = backup_dir / "big.bin"
+        backup_file.write_bytes(b"B" + b"x" * (size - 1))
+        source_files = _hashed_source(source_dir, backup_file, source_content)
+
+        with patch("smartbackup.core.hashcache.hash_file") as hash_file:
+            _, modified_files, _ = ChangeDetector(use_hash=True).detect_changes(
+                source_files, backup_dir, BackupLogger(verbose=False)
+            )
+
+        hash_file.assert_not_called()
+        assert len(modified_files) == 1
+
+    def test_head_compare_no_false_positives(self, source_dir: Path, backup_dir: Path):
+        """Matching heads should fall through to the full hash."""
+        size = HEAD_COMPARE_SIZE * 2
+        content = b"x" * size
+        (source_dir / "big.bin").write_bytes(content)
+        backup_file = backup_dir / "big.bin"
+        backup_file.write_bytes(content)
+        source_files = _hashed_source(source_dir, backup_file, content)
+
+        _, modified_files, _ = ChangeDetector(use_hash=True).detect_changes(
+            source_files, backup_dir, BackupLogger(verbose=False)
+        )
+        assert modified_files == []
+
+        # A change past the head is still caught by the full hash
+        backup_file.write_bytes(content[:-1] + b"y")
+        source_files = _hashed_source(source_dir, backup_file, content)
+
+        _, modified_files, _ = ChangeDetector(use_hash=True).detect_changes(
+            source_files, backup_dir, BackupLogger(verbose=False)
+        )
+        assert len(modified_files) == 1
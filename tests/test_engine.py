@@ -3,11 +3,13 @@ Tests for the engine module.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from smartbackup.config import BackupConfig
 from smartbackup.core.engine import BackupEngine, DryRunBackupEngine
+from smartbackup.core.hashcache import HASH_CACHE_FILENAME
 from smartbackup.models import FileAction, FileInfo
 from smartbackup.ui.logger import BackupLogger
 
@@ -54,6 +56,17 @@ class TestBackupEngine:
 
         assert engine._validate_paths() is False
 
+    def test_validate_paths_source_is_file(self, source_dir: Path, backup_dir: Path):
+        """Path validation should fail if the source is a file."""
+        config = BackupConfig(
+            source_path=source_dir / "file1.txt",
+            backup_path=backup_dir,
+        )
+        logger = BackupLogger(verbose=False)
+        engine = BackupEngine(config, logger)
+
+        assert engine._validate_paths() is False
+
     def test_copy_single_file(self, source_dir: Path, backup_dir: Path):
         """Single file copying should work."""
         config = BackupConfig(source_path=source_dir, backup_path=backup_dir)
@@ -163,6 +176,70 @@ class TestBackupEngine:
         assert result2.copied_files == 0
         assert result2.skipped_files == copied_first
 
+    def test_run_backup_new_and_modified_in_one_pass(self, source_dir: Path, backup_dir: Path):
+        """New and modified files should be copied together with correct counts."""
+        config = BackupConfig(
+            source_path=source_dir,
+            backup_path=backup_dir,
+            backup_folder_name="TestBackup",
+            log_to_file=False,
+            max_workers=1,
+        )
+        logger = BackupLogger(verbose=False)
+        BackupEngine(config, logger).run_backup()
+
+        for i in range(10):
+            (source_dir / f"extra{i}.txt").write_text(f"extra {i}")
+        (source_dir / "file1.txt").write_text("Hello World, updated")
+
+        result = BackupEngine(config, logger).run_backup()
+
+        assert result.copied_files == 10
+        assert result.updated_files == 1
+        assert result.errors == 0
+        assert (backup_dir / "TestBackup" / "extra9.txt").read_text() == "extra 9"
+        assert (backup_dir / "TestBackup" / "file1.txt").read_text() == "Hello World, updated"
+
+    def test_run_backup_many_files_concurrently(self, source_dir: Path, backup_dir: Path):
+        """Copies spread over many workers should all land with correct counts."""
+        many = source_dir / "many"
+        many.mkdir()
+        for i in range(100):
+            (many / f"file{i:03d}.txt").write_text(f"content {i}")
+
+        config = BackupConfig(
+            source_path=source_dir,
+            backup_path=backup_dir,
+            backup_folder_name="TestBackup",
+            log_to_file=False,
+            max_workers=8,
+        )
+        result = BackupEngine(config, BackupLogger(verbose=False)).run_backup()
+
+        assert result.errors == 0
+        assert result.copied_files == result.total_files
+        copied = sorted((backup_dir / "TestBackup" / "many").iterdir())
+        assert len(copied) == 100
+        assert copied[42].read_text() == "content 42"
+
+    def test_run_backup_counts_failed_copies(self, source_dir: Path, backup_dir: Path):
+        """Failed copies should be counted as errors, not as copied files."""
+        config = BackupConfig(
+            source_path=source_dir,
+            backup_path=backup_dir,
+            backup_folder_name="TestBackup",
+            log_to_file=False,
+        )
+        engine = BackupEngine(config, BackupLogger(verbose=False))
+
+        with patch.object(engine, "_copy_single_file", return_value=(False, "Permission denied")):
+            result = engine.run_backup()
+
+        assert result.copied_files == 0
+        assert result.copied_size == 0
+        assert result.errors == result.total_files
+        assert all(action == FileAction.ERROR for _, action, _ in result.file_actions)
+
 
 class TestDryRunBackupEngine:
     """Tests for DryRunBackupEngine class."""
@@ -209,3 +286,22 @@ class TestDryRunBackupEngine:
         # File should still exist
         assert test_file.exists()
         assert engine.result.deleted_files == 1
+
+    def test_dry_run_does_not_create_hash_cache(self, source_dir: Path, backup_dir: Path):
+        """Hash-based change detection in a dry run must not write the cache to the target."""
+        BackupEngine(
+            BackupConfig(source_path=source_dir, backup_path=backup_dir, use_manifest=False),
+            BackupLogger(verbose=False),
+        ).run_backup()
+
+        config = BackupConfig(
+            source_path=source_dir,
+            backup_path=backup_dir,
+            use_manifest=False,
+            use_hash_verification=True,
+            hash_all_files=True,
+        )
+        result = DryRunBackupEngine(config, BackupLogger(verbose=False)).run_backup()
+
+        assert result.skipped_files == result.total_files
+        assert not list(backup_dir.rglob(f"{HASH_CACHE_FILENAME}*"))
@@ -0,0 +1,109 @@
+"""
+Tests for the fastcopy module.
+"""
+
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from smartbackup.core.fastcopy import copy_file
+
+
+class TestCopyFile:
+    """Tests for copy_file."""
+
+    def test_copies_content_and_mtime(self, temp_dir: Path):
+        """Content and modification time should match the source."""
+        src = temp_dir / "src.bin"
+        src.write_bytes(os.urandom(300_000))
+        os.utime(src, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+        dst = temp_dir / "dst.bin"
+
+        copy_file(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    def test_copies_empty_file(self, temp_dir: Path):
+        """Empty files should be copied."""
+        src = temp_dir / "empty.txt"
+        src.touch()
+        dst = temp_dir / "copy.txt"
+
+        copy_file(src, dst)
+
+        assert dst.exists()
+        assert dst.stat().st_size == 0
+
+    def test_overwrites_existing_destination(self, temp_dir: Path):
+        """An existing, longer destination should be replaced entirely."""
+        src = temp_dir / "src.txt"
+        src.write_text("short")
+        dst = temp_dir / "dst.txt"
+        dst.write_text("a much longer previous version")
+
+        copy_file(src, dst)
+
+        assert dst.read_text() == "short"
+
+    def test_refuses_hard_link_to_itself(self, temp_dir: Path):
+        """Copying onto a hard link of the source must not truncate it."""
+        src = temp_dir / "src.txt"
+        src.write_text("linked content")
+        dst = temp_dir / "dst.txt"
+        os.link(src, dst)
+
+        with pytest.raises(shutil.SameFileError):
+            copy_file(src, dst)
+
+        assert src.read_text() == "linked content"
+
+    def test_falls_back_when_copy_range_unsupported(self, temp_dir: Path):
+        """Cross-device or unsupported errors should fall back to a regular copy."""
+        src = temp_dir / "src.txt"
+        src.write_text("fallback content")
+        dst = temp_dir / "dst.txt"
+
+        with patch(
+            "smartbackup.core.fastcopy.os.copy_file_range",
+            side_effect=OSError(errno.EXDEV, "cross-device"),
+            create=True,
+        ):
+            copy_file(src, dst)
+
+        assert dst.read_text() == "fallback content"
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="FICLONE is Linux-only")
+    def test_reflinks_when_clone_succeeds(self, temp_dir: Path):
+        """A successful FICLONE should finish the copy without copy_file_range."""
+        src = temp_dir / "src.txt"
+        src.write_text("cloned")
+        dst = temp_dir / "dst.txt"
+
+        with patch("smartbackup.core.fastcopy._clone", return_value=True) as clone, patch(
+            "smartbackup.core.fastcopy._copy_range"
+        ) as copy_range:
+            copy_file(src, dst)
+
+        clone.assert_called_once()
+        copy_range.assert_not_called()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="FICLONE is Linux-only")
+    def test_falls_back_when_clone_unsupported(self, temp_dir: Path):
+        """Filesystems without reflink support should still get a full copy."""
+        src = temp_dir / "src.txt"
+        src.write_text("copied content")
+        dst = temp_dir / "dst.txt"
+
+        with patch(
+            "smartbackup.core.fastcopy.fcntl.ioctl",
+            side_effect=OSError(errno.EOPNOTSUPP, "not supported"),
+        ):
+            copy_file(src, dst)
+
+        assert dst.read_text() == "copied content"
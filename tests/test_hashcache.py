@@ -0,0 +1,53 @@
+"""
+Tests for the hash cache module.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from smartbackup.core.hashcache import HASH_CACHE_FILENAME, HashCache
+
+
+class TestHashCache:
+    """Tests for HashCache class."""
+
+    def test_get_missing_returns_none(self, temp_dir: Path):
+        """Unknown paths should not produce a digest."""
+        with HashCache(temp_dir / HASH_CACHE_FILENAME) as cache:
+            assert cache.get("missing.txt", 1, 1) is None
+
+    def test_put_and_get(self, temp_dir: Path):
+        """A stored digest should be returned for the same size and mtime."""
+        with HashCache(temp_dir / HASH_CACHE_FILENAME) as cache:
+            cache.put("file.txt", 10, 123, "abc")
+            assert cache.get("file.txt", 10, 123) == "abc"
+            assert cache.get("file.txt", 11, 123) is None
+            assert cache.get("file.txt", 10, 124) is None
+
+    def test_persists_across_instances(self, temp_dir: Path):
+        """Entries should survive closing and reopening the cache."""
+        db_path = temp_dir / HASH_CACHE_FILENAME
+        with HashCache(db_path) as cache:
+            cache.put("file.txt", 10, 123, "abc")
+
+        with HashCache(db_path) as cache:
+            assert cache.get("file.txt", 10, 123) == "abc"
+
+    def test_digest_invalidated_by_mtime(self, temp_dir: Path):
+        """A cached digest should not be returned once the file changes."""
+        target = temp_dir / "file.txt"
+        target.write_text("first")
+
+        with HashCache(temp_dir / HASH_CACHE_FILENAME) as cache:
+            first = cache.digest("file.txt", target, target.stat())
+            assert cache.digest("file.txt", target, target.stat()) == first
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            target.write_text("second")
+            stat = target.stat()
+            os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            second = cache.digest("file.txt", target, target.stat())
+
+        assert second != first
+        assert second == hashlib.sha256(b"second").hexdigest()
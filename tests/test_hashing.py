@@ -0,0 +1,43 @@
+"""
+Tests for the hashing module.
+"""
+
+import hashlib
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from smartbackup.hashing import HASH_CHUNK_SIZE, hash_file
+
+
+class TestHashFile:
+    """Tests for hash_file."""
+
+    def test_sha256_digest(self, temp_dir: Path):
+        """The default digest should be SHA-256 of the content."""
+        path = temp_dir / "data.bin"
+        path.write_bytes(b"hello world")
+
+        assert hash_file(path) == hashlib.sha256(b"hello world").hexdigest()
+
+    def test_other_algorithm(self, temp_dir: Path):
+        """Any hashlib algorithm name should be accepted."""
+        path = temp_dir / "data.bin"
+        path.write_bytes(b"hello world")
+
+        assert hash_file(path, "md5") == hashlib.md5(b"hello world").hexdigest()
+
+    def test_buffered_fallback_matches(self, temp_dir: Path):
+        """The pre-3.11 readinto loop should give the same digest across chunks."""
+        content = bytes(range(256)) * (HASH_CHUNK_SIZE // 256 * 2 + 3)
+        path = temp_dir / "large.bin"
+        path.write_bytes(content)
+
+        with patch("smartbackup.hashing._file_digest", None):
+            assert hash_file(path) == hashlib.sha256(content).hexdigest()
+
+    def test_missing_file_raises(self, temp_dir: Path):
+        """Unreadable files should raise OSError."""
+        with pytest.raises(OSError):
+            hash_file(temp_dir / "missing.bin")
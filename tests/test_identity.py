@@ -4,9 +4,19 @@ Tests for the platform identity module.
 
 from unittest.mock import patch
 
+import pytest
+
 from smartbackup.platform.identity import get_device_name
 
 
+@pytest.fixture(autouse=True)
+def clear_device_name_cache():
+    """get_device_name() caches its result; reset it around every test."""
+    get_device_name.cache_clear()
+    yield
+    get_device_name.cache_clear()
+
+
 class TestGetDeviceName:
     """Tests for get_device_name() function."""
 
@@ -87,3 +97,19 @@ class TestGetDeviceName:
         """Should handle a simple hostname without suffix."""
         mock_platform.node.return_value = "Office-Desktop"
         assert get_device_name() == "Office-Desktop"
+
+    @patch("smartbackup.platform.identity.platform")
+    def test_unicode_letters_preserved(self, mock_platform):
+        """Non-ASCII letters and digits are kept, like regex \\w."""
+        mock_platform.node.return_value = "Büro-PC ٣"
+        assert get_device_name() == "Büro-PC-٣"
+
+    @patch("smartbackup.platform.identity.platform")
+    def test_result_is_cached(self, mock_platform):
+        """The hostname is only read once per process."""
+        mock_platform.node.return_value = "first-host"
+        assert get_device_name() == "first-host"
+
+        mock_platform.node.return_value = "second-host"
+        assert get_device_name() == "first-host"
+        mock_platform.node.assert_called_once()
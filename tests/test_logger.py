@@ -2,14 +2,17 @@
 Tests for the logger module.
 """
 
+import os
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from smartbackup.models import BackupResult, FileAction
 from smartbackup.ui.colors import Colors
-from smartbackup.ui.logger import BackupLogger
+from smartbackup.ui.logger import PROGRESS_INTERVAL, BackupLogger
 
 
 class TestColors:
@@ -26,29 +29,25 @@ class TestColors:
 
     def test_colors_disable(self):
         """Colors should be disableable."""
-        # Save original values
-        original_red = Colors.RED
-        original_green = Colors.GREEN
-
-        # Disable colors
         Colors.disable()
+        try:
+            # All should be empty
+            assert Colors.RED == ""
+            assert Colors.GREEN == ""
+            assert Colors.BLUE == ""
+            assert Colors.END == ""
+        finally:
+            Colors.enable()
+
+    def test_colors_enable_restores_codes(self):
+        """enable() should bring back every code after disable()."""
+        Colors.disable()
+        Colors.disable()
+        Colors.enable()
 
-        # All should be empty
-        assert Colors.RED == ""
-        assert Colors.GREEN == ""
-        assert Colors.BLUE == ""
-        assert Colors.END == ""
-
-        # Restore (for other tests)
-        Colors.RED = original_red
-        Colors.GREEN = original_green
-        Colors.HEADER = "\033[95m"
-        Colors.BLUE = "\033[94m"
-        Colors.CYAN = "\033[96m"
-        Colors.YELLOW = "\033[93m"
-        Colors.BOLD = "\033[1m"
-        Colors.UNDERLINE = "\033[4m"
-        Colors.END = "\033[0m"
+        assert Colors.RED == "\033[91m"
+        assert Colors.HEADER == "\033[95m"
+        assert Colors.END == "\033[0m"
 
 
 class TestBackupLogger:
@@ -87,6 +86,17 @@ class TestBackupLogger:
         logger = BackupLogger()
         assert "GB" in logger._format_size(1024 * 1024 * 1024)
 
+    def test_format_size_unit_boundaries(self):
+        """Each unit should start exactly at its power of 1024."""
+        logger = BackupLogger()
+        assert logger._format_size(0) == "0.0B"
+        assert logger._format_size(1023) == "1023.0B"
+        assert logger._format_size(1024) == "1.0KB"
+        assert logger._format_size(1536) == "1.5KB"
+        assert logger._format_size(1024**2 - 1) == "1024.0KB"
+        assert logger._format_size(5 * 1024**4) == "5.0TB"
+        assert logger._format_size(2048 * 1024**5) == "2048.0PB"
+
     def test_timestamp_format(self):
         """Timestamp should be properly formatted."""
         logger = BackupLogger()
@@ -96,6 +106,19 @@ class TestBackupLogger:
         assert "-" in timestamp
         assert ":" in timestamp
 
+    def test_timestamp_reused_within_second(self):
+        """The formatted timestamp should only change when the second changes."""
+        logger = BackupLogger()
+        with patch("smartbackup.ui.logger.time.time", return_value=1_700_000_000.2):
+            first = logger._timestamp()
+        with patch("smartbackup.ui.logger.time.time", return_value=1_700_000_000.9):
+            assert logger._timestamp() is first
+        with patch("smartbackup.ui.logger.time.time", return_value=1_700_000_001.0):
+            second = logger._timestamp()
+
+        assert second != first
+        assert second == time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1_700_000_001))
+
     def test_log_buffer(self):
         """Log buffer should accumulate messages."""
         with tempfile.NamedTemporaryFile(suffix=".log", delete=False) as f:
@@ -115,6 +138,7 @@ class TestBackupLogger:
         logger = BackupLogger(log_file=log_path, verbose=False)
         logger._log_to_file("Test message")
         logger.flush_to_file()
+        logger.close()
 
         content = log_path.read_text()
         assert "Test message" in content
@@ -122,6 +146,46 @@ class TestBackupLogger:
         # Cleanup
         log_path.unlink()
 
+    def test_flush_to_file_appends_in_order(self):
+        """Flushing many lines should append them in order after existing content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "backup.log"
+            log_path.write_text("HEADER\n", encoding="utf-8")
+
+            logger = BackupLogger(log_file=log_path, verbose=False)
+            for i in range(3000):
+                logger._log_to_file(f"line {i} ü")
+            logger.flush_to_file()
+            logger.close()
+
+            lines = log_path.read_text(encoding="utf-8").splitlines()
+            assert lines[0] == "HEADER"
+            assert lines[1:] == [f"line {i} ü" for i in range(3000)]
+            assert logger._log_buffer == []
+
+    def test_flush_reuses_log_descriptor(self):
+        """Repeated flushes should share one descriptor until the path changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "first.log"
+            second = Path(tmpdir) / "second.log"
+            logger = BackupLogger(log_file=first, verbose=False)
+
+            with patch("smartbackup.ui.logger.os.open", wraps=os.open) as os_open:
+                logger._log_to_file("one")
+                logger.flush_to_file()
+                logger._log_to_file("two")
+                logger.flush_to_file()
+                assert os_open.call_count == 1
+
+                logger.log_file = second
+                logger._log_to_file("three")
+                logger.close()
+                assert os_open.call_count == 2
+
+            assert first.read_text() == "one\ntwo\n"
+            assert second.read_text() == "three\n"
+            assert logger._log_fd is None
+
     def test_file_action_logging(self, capsys):
         """File action logging should work."""
         logger = BackupLogger(verbose=True)
@@ -170,3 +234,23 @@ class TestBackupLogger:
         logger._clear_progress_line()
 
         assert logger._progress_line_active is False
+
+    def test_progress_updates_are_throttled(self):
+        """Updates within PROGRESS_INTERVAL should be skipped, except the last one."""
+        logger = BackupLogger(verbose=True)
+        try:
+            with patch("smartbackup.ui.logger.time.monotonic", return_value=1000.0):
+                logger.progress(1, 100, "a.txt")
+                logger.progress(2, 100, "b.txt")
+                task = logger._progress_bar.tasks[0]
+                assert task.completed == 1
+
+                logger.progress(100, 100, "c.txt")
+                assert task.completed == 100
+
+            later = 1000.0 + PROGRESS_INTERVAL
+            with patch("smartbackup.ui.logger.time.monotonic", return_value=later):
+                logger.progress(50, 100, "d.txt")
+                assert task.completed == 50
+        finally:
+            logger._stop_progress()
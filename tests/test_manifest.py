@@ -2,20 +2,18 @@
 
 import hashlib
 import json
+import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from smartbackup.manifest.base import (
-    Manifest,
-    ManifestDiff,
-    ManifestEntry,
-    ManifestFormat,
-)
+from smartbackup.manifest.base import Manifest, ManifestDiff, ManifestEntry, ManifestFormat
 from smartbackup.manifest.json_manifest import JsonManifestManager
 from smartbackup.models import FileInfo
+from smartbackup.parallel import STAT_PARALLEL_THRESHOLD
 
 
 class TestManifestEntry:
@@ -39,6 +37,22 @@ class TestManifestEntry:
         assert entry.permissions == 0o644
         assert entry.backed_up_at == 1706695200.0
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_entry_has_no_instance_dict(self) -> None:
+        """Entries should use slots instead of a per-instance __dict__."""
+        entry = ManifestEntry(
+            relative_path="test/file.txt",
+            file_hash="abc123",
+            size=1024,
+            mtime=1706691600.0,
+            permissions=0o644,
+            backed_up_at=1706695200.0,
+        )
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = 1  # type: ignore[attr-defined]
+
     def test_to_dict(self) -> None:
         """Test converting entry to dictionary."""
         entry = ManifestEntry(
@@ -58,6 +72,28 @@ class TestManifestEntry:
         assert data["permissions"] == 0o644
         assert data["backed_up_at"] == 1706695200.0
 
+    def test_to_dict_stores_backed_up_at_in_whole_seconds(self) -> None:
+        """backed_up_at is written as whole seconds; mtime keeps its precision."""
+        entry = ManifestEntry(
+            relative_path="test/file.txt",
+            file_hash="abc123",
+            size=1024,
+            mtime=1706691600.25,
+            permissions=0o644,
+            backed_up_at=1706695200.75,
+        )
+
+        data = entry.to_dict()
+
+        assert data["backed_up_at"] == 1706695200
+        assert isinstance(data["backed_up_at"], int)
+        assert data["mtime"] == 1706691600.25
+
+        restored = ManifestEntry.from_dict("test/file.txt", data)
+        assert restored.backed_up_at == 1706695200.0
+        assert isinstance(restored.backed_up_at, float)
+        assert restored.mtime == 1706691600.25
+
     def test_from_dict(self) -> None:
         """Test creating entry from dictionary."""
         data = {
@@ -94,6 +130,20 @@ class TestManifestEntry:
         assert entry.file_hash == "somehash"
         assert entry.size == 13
 
+    def test_from_file_info_uses_scanned_mode(self, tmp_path: Path) -> None:
+        """A mode recorded by the scan should be used without stat'ing the file."""
+        file_info = FileInfo(
+            path=tmp_path / "gone.txt",  # never created
+            relative_path=Path("gone.txt"),
+            size=13,
+            mtime=1000.0,
+            mode=0o100600,
+        )
+
+        entry = ManifestEntry.from_file_info(file_info)
+
+        assert entry.permissions == 0o100600
+
     def test_has_changed_size_different(self) -> None:
         """Test change detection when size differs."""
         entry = ManifestEntry(
@@ -257,6 +307,26 @@ class TestManifest:
         assert restored.total_files == 1
         assert restored.has_entry("test.txt")
 
+    def test_entry_serialization_matches_entry_methods(self) -> None:
+        """Manifest (de)serialization should agree with ManifestEntry.to_dict/from_dict."""
+        manifest = Manifest()
+        entry = ManifestEntry(
+            relative_path="a/b.txt",
+            file_hash="abc123",
+            size=1024,
+            mtime=1000.5,
+            permissions=0o600,
+            backed_up_at=1001.0,
+        )
+        manifest.add_entry(entry)
+
+        assert manifest.to_dict()["files"]["a/b.txt"] == entry.to_dict()
+
+        data = {"files": {"full.txt": entry.to_dict(), "sparse.txt": {"size": 7}}}
+        restored = Manifest.from_dict(data)
+        for path, entry_data in data["files"].items():
+            assert restored.get_entry(path) == ManifestEntry.from_dict(path, entry_data)
+
     def test_hostname_default_empty(self) -> None:
         """Test that hostname defaults to empty string."""
         manifest = Manifest()
@@ -343,6 +413,31 @@ class TestJsonManifestManager:
         assert loaded.total_files == 1
         assert loaded.has_entry("test.txt")
 
+    def test_save_writes_utf8_json(self, tmp_path: Path) -> None:
+        """Non-ASCII paths should be stored as UTF-8 and survive a round trip."""
+        manager = JsonManifestManager(tmp_path)
+
+        manifest = Manifest(source="/test/path")
+        manifest.add_entry(
+            ManifestEntry(
+                relative_path="fotos/größe_日本.txt",
+                file_hash="abc123",
+                size=1,
+                mtime=1000.5,
+                permissions=0o644,
+                backed_up_at=1000.0,
+            )
+        )
+        assert manager.save(manifest) is True
+
+        raw = manager.manifest_path.read_bytes()
+        assert "größe_日本".encode() in raw
+        assert json.loads(raw)["files"]["fotos/größe_日本.txt"]["mtime"] == 1000.5
+
+        loaded = manager.load()
+        assert loaded is not None
+        assert loaded.has_entry("fotos/größe_日本.txt")
+
     def test_load_or_create_new(self, tmp_path: Path) -> None:
         """Test load_or_create creates new manifest."""
         manager = JsonManifestManager(tmp_path)
@@ -431,6 +526,32 @@ class TestJsonManifestManager:
         assert len(diff.deleted_paths) == 1
         assert diff.deleted_paths[0] == "to_delete.txt"
 
+    def test_diff_detects_hash_change(self, tmp_path: Path) -> None:
+        """Same size and mtime but a different hash should count as modified."""
+        manager = JsonManifestManager(tmp_path)
+        manifest = Manifest(source="/test")
+        for name, file_hash in (("same.txt", "abc"), ("changed.txt", "abc"), ("nohash.txt", "")):
+            manifest.add_entry(
+                ManifestEntry(
+                    relative_path=name,
+                    file_hash=file_hash,
+                    size=100,
+                    mtime=1000.0,
+                    permissions=0o644,
+                    backed_up_at=1000.0,
+                )
+            )
+
+        source_files = {
+            Path(name): FileInfo(Path("/src") / name, Path(name), 100, 1000.0, file_hash)
+            for name, file_hash in (("same.txt", "abc"), ("changed.txt", "xyz"), ("nohash.txt", "xyz"))
+        }
+
+        diff = manager.diff(source_files, manifest)
+
+        assert [f.relative_path for f in diff.modified_files] == [Path("changed.txt")]
+        assert len(diff.unchanged_files) == 2
+
     def test_update_from_backup(self, tmp_path: Path) -> None:
         """Test updating manifest after backup."""
         manager = JsonManifestManager(tmp_path)
@@ -520,6 +641,38 @@ class TestJsonManifestManager:
         assert len(errors) == 1
         assert "Size mismatch" in errors[0]
 
+    def test_verify_large_manifest_in_parallel(self, tmp_path: Path) -> None:
+        """Test that the threaded stat path reports errors in manifest order."""
+        manager = JsonManifestManager(tmp_path)
+        count = STAT_PARALLEL_THRESHOLD + 10
+
+        manifest = Manifest()
+        for i in range(count):
+            name = f"file_{i:04d}.txt"
+            if i % 3:
+                (tmp_path / name).write_text("data")
+            manifest.add_entry(
+                ManifestEntry(
+                    relative_path=name,
+                    file_hash="abc",
+                    size=4 if i % 3 == 1 else 5,
+                    mtime=1000.0,
+                    permissions=0o644,
+                    backed_up_at=1000.0,
+                )
+            )
+
+        errors = manager.verify(manifest, tmp_path)
+
+        expected = []
+        for i in range(count):
+            name = f"file_{i:04d}.txt"
+            if i % 3 == 0:
+                expected.append(f"Missing: {name}")
+            elif i % 3 == 2:
+                expected.append(f"Size mismatch: {name} (expected 5, got 4)")
+        assert errors == expected
+
     def test_atomic_save(self, tmp_path: Path) -> None:
         """Test that save is atomic (uses temp file)."""
         manager = JsonManifestManager(tmp_path)
@@ -536,6 +689,31 @@ class TestJsonManifestManager:
         # Check that manifest file exists
         assert manager.manifest_path.exists()
 
+    def test_save_streams_in_chunks(self, tmp_path: Path) -> None:
+        """Chunked encoding should write exactly the indented JSON document."""
+        manager = JsonManifestManager(tmp_path)
+        manifest = Manifest(source="/test")
+        for i in range(50):
+            manifest.add_entry(
+                ManifestEntry(
+                    relative_path=f"dir/file{i}.txt",
+                    file_hash="abc",
+                    size=i,
+                    mtime=1000.0 + i,
+                    permissions=0o644,
+                    backed_up_at=1000.0,
+                )
+            )
+
+        with patch("smartbackup.manifest.json_manifest.ENCODE_CHUNK_SIZE", 64):
+            assert manager.save(manifest) is True
+
+        raw = manager.manifest_path.read_bytes()
+        assert json.loads(raw) == json.loads(json.dumps(manifest.to_dict()))
+        loaded = manager.load()
+        assert loaded is not None
+        assert loaded.total_files == 50
+
     def test_load_corrupted_manifest(self, tmp_path: Path) -> None:
         """Test loading a corrupted manifest returns None."""
         manager = JsonManifestManager(tmp_path)
@@ -818,6 +996,81 @@ class TestHashVerification:
 
         assert len(errors) == 0
 
+    def test_verify_uses_manifest_hash_algorithm(self, tmp_path: Path) -> None:
+        """Old MD5 manifests should be verified with MD5, not SHA-256."""
+        manager = JsonManifestManager(tmp_path)
+
+        content = b"legacy content"
+        (tmp_path / "old.txt").write_bytes(content)
+
+        manifest = Manifest(hash_algorithm="md5")
+        manifest.add_entry(
+            ManifestEntry(
+                relative_path="old.txt",
+                file_hash=hashlib.md5(content).hexdigest(),
+                size=len(content),
+                mtime=1000.0,
+                permissions=0o644,
+                backed_up_at=1000.0,
+            )
+        )
+
+        assert manager.verify(manifest, tmp_path, verify_hashes=True) == []
+
+        (tmp_path / "old.txt").write_bytes(b"LEGACY CONTENT")
+        errors = manager.verify(manifest, tmp_path, verify_hashes=True)
+        assert len(errors) == 1
+        assert "Hash mismatch" in errors[0]
+
+    def test_update_switches_legacy_manifest_to_new_algorithm(
+        self, tmp_path: Path
+    ) -> None:
+        """Refreshing part of an MD5 manifest with SHA-256 files must not
+        leave verify() comparing digests of different algorithms."""
+        manager = JsonManifestManager(tmp_path)
+
+        old_content = b"untouched legacy file"
+        new_content = b"refreshed file"
+        (tmp_path / "old.txt").write_bytes(old_content)
+        (tmp_path / "new.txt").write_bytes(new_content)
+
+        manifest = Manifest(hash_algorithm="md5")
+        for name, content in (("old.txt", old_content), ("new.txt", b"stale")):
+            manifest.add_entry(
+                ManifestEntry(
+                    relative_path=name,
+                    file_hash=hashlib.md5(content).hexdigest(),
+                    size=len(content),
+                    mtime=1000.0,
+                    permissions=0o644,
+                    backed_up_at=1000.0,
+                )
+            )
+
+        backed_up = [
+            FileInfo(
+                tmp_path / "new.txt",
+                Path("new.txt"),
+                len(new_content),
+                2000.0,
+                hashlib.sha256(new_content).hexdigest(),
+            )
+        ]
+        manifest = manager.update_from_backup(
+            manifest, backed_up, hash_algorithm="sha256"
+        )
+        manager.save(manifest)
+        manifest = manager.load()
+
+        assert manifest.hash_algorithm == "sha256"
+        assert manifest.get_entry("old.txt").file_hash == ""
+        assert manager.verify(manifest, tmp_path, verify_hashes=True) == []
+
+        (tmp_path / "new.txt").write_bytes(b"REFRESHED FILE")
+        errors = manager.verify(manifest, tmp_path, verify_hashes=True)
+        assert len(errors) == 1
+        assert "new.txt" in errors[0]
+
 
 class TestMtimeComparison:
     """Tests for the mtime != fix in ManifestEntry.has_changed() and FileInfo.needs_update()."""
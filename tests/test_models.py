@@ -2,6 +2,8 @@
 Tests for the models module.
 """
 
+import dataclasses
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -53,6 +55,23 @@ class TestFileInfo:
 
         assert info.file_hash == "abc123"
 
+    def test_from_direntry(self, temp_dir: Path):
+        """FileInfo.from_direntry should take size, mtime and mode from the entry."""
+        test_file = temp_dir / "entry.txt"
+        test_file.write_text("scandir")
+        stat = test_file.stat()
+
+        with os.scandir(temp_dir) as it:
+            entry = next(e for e in it if e.name == "entry.txt")
+            info = FileInfo.from_direntry(entry, Path("entry.txt"), "hash")
+
+        assert info.path == test_file
+        assert info.relative_path == Path("entry.txt")
+        assert info.size == stat.st_size
+        assert info.mtime == stat.st_mtime
+        assert info.mode == stat.st_mode
+        assert info.file_hash == "hash"
+
     def test_needs_update_different_size(self, temp_dir: Path):
         """File needs update if size differs."""
         source = FileInfo(
@@ -142,6 +161,18 @@ class TestFileInfo:
 
         assert source.needs_update(backup, use_hash=True) is False
 
+    def test_file_info_is_frozen(self, temp_dir: Path):
+        """FileInfo fields should not be reassignable after creation."""
+        info = FileInfo(
+            path=temp_dir / "test.txt",
+            relative_path=Path("test.txt"),
+            size=100,
+            mtime=1234567890.0,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.size = 200  # type: ignore[misc]
+
 
 class TestBackupResult:
     """Tests for BackupResult dataclass."""
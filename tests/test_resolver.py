@@ -3,12 +3,23 @@ Tests for the platform resolver module.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from smartbackup.platform.resolver import PathResolver
 
 
+@pytest.fixture(autouse=True)
+def clear_resolver_caches():
+    """Documents path and drive list are cached; reset them around every test."""
+    PathResolver.get_documents_path.cache_clear()
+    PathResolver._drive_cache = None
+    yield
+    PathResolver.get_documents_path.cache_clear()
+    PathResolver._drive_cache = None
+
+
 class TestPathResolver:
     """Tests for PathResolver class."""
 
@@ -55,6 +66,31 @@ class TestPathResolver:
         for path, label, free in drives:
             assert free >= 0
 
+    def test_get_documents_path_is_cached(self, monkeypatch, tmp_path: Path):
+        """The documents path should be resolved once per process."""
+        monkeypatch.setattr("smartbackup.platform.resolver.platform.system", lambda: "Linux")
+        monkeypatch.setenv("XDG_DOCUMENTS_DIR", str(tmp_path / "first"))
+        first = PathResolver.get_documents_path()
+
+        monkeypatch.setenv("XDG_DOCUMENTS_DIR", str(tmp_path / "second"))
+        assert PathResolver.get_documents_path() == first
+
+        PathResolver.get_documents_path.cache_clear()
+        assert PathResolver.get_documents_path() == tmp_path / "second"
+
+    def test_find_external_drives_is_cached_briefly(self, monkeypatch):
+        """Drive scans should be reused within max_age and redone with max_age=0."""
+        drive = (Path("/media/usb"), "usb", 1024)
+        monkeypatch.setattr("smartbackup.platform.resolver.platform.system", lambda: "Linux")
+
+        with patch.object(PathResolver, "_find_linux_drives", return_value=[drive]) as find:
+            assert PathResolver.find_external_drives() == [drive]
+            assert PathResolver.find_external_drives() == [drive]
+            assert find.call_count == 1
+
+            PathResolver.find_external_drives(max_age=0)
+            assert find.call_count == 2
+
 
 class TestPathResolverPlatformMethods:
     """Tests for platform-specific methods."""
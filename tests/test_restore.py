@@ -1,11 +1,15 @@
 """Tests for the restore engine."""
 
+import errno
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from smartbackup.core.restore import (
+    DEFAULT_RESTORE_WORKERS,
     ConflictResolution,
     RestoreEngine,
     RestoreResult,
@@ -170,6 +174,39 @@ class TestRestoreEngine:
         # File should be overwritten with backup content
         assert (target / "file1.txt").read_text() == "Content 1"
 
+    def test_restore_rename_keeps_existing_file(self, backup_structure: tuple) -> None:
+        """RENAME restores next to an existing file instead of replacing it."""
+        backup_base, target = backup_structure
+        (target / "file1.txt").write_text("Local edit")
+        (target / "file1 (restored).txt").write_text("Earlier restore")
+
+        engine = RestoreEngine(backup_path=backup_base, target_path=target)
+        result = engine.restore(conflict_resolution=ConflictResolution.RENAME)
+
+        assert result.errors == 0
+        assert result.restored_files == 3
+        assert (target / "file1.txt").read_text() == "Local edit"
+        assert (target / "file1 (restored).txt").read_text() == "Earlier restore"
+        assert (target / "file1 (restored 2).txt").read_text() == "Content 1"
+
+    def test_restore_newer_skips_newer_target(self, backup_structure: tuple) -> None:
+        """NEWER only replaces files the backup copy is newer than."""
+        backup_base, target = backup_structure
+        backup_folder = backup_base / "Documents-Backup"
+        (target / "file1.txt").write_text("Newer local")
+        (target / "file2.txt").write_text("Older local")
+        os.utime(backup_folder / "file1.txt", (1000, 1000))
+        os.utime(target / "file2.txt", (1000, 1000))
+
+        engine = RestoreEngine(backup_path=backup_base, target_path=target)
+        result = engine.restore(conflict_resolution=ConflictResolution.NEWER)
+
+        assert result.errors == 0
+        assert result.skipped_files == 1
+        assert result.overwritten_files == 1
+        assert (target / "file1.txt").read_text() == "Newer local"
+        assert (target / "file2.txt").read_text() == "Content 2"
+
     def test_restore_creates_directories(self, backup_structure: tuple) -> None:
         """Test that restore creates necessary directories."""
         backup_base, target = backup_structure
@@ -191,6 +228,106 @@ class TestRestoreEngine:
         assert (target / "a" / "b" / "c" / "deep.txt").exists()
         assert (target / "a" / "b" / "c" / "deep.txt").read_text() == "Deep content"
 
+    def test_restore_totals_from_streamed_files(self, backup_structure: tuple) -> None:
+        """Totals are accumulated while files stream into the worker pool."""
+        backup_base, target = backup_structure
+
+        engine = RestoreEngine(backup_path=backup_base, target_path=target)
+        pending = engine._iter_files()
+        assert next(pending)[1] == len("Content 1")  # lazy (path, size) pairs
+
+        result = engine.restore()
+
+        assert result.total_files == 3
+        assert result.total_size == 3 * len("Content 1")
+        assert result.restored_size == result.total_size
+
+    def test_max_workers_default_and_override(self, backup_structure: tuple) -> None:
+        """The engine's max_workers defaults to DEFAULT_RESTORE_WORKERS."""
+        backup_base, target = backup_structure
+
+        assert RestoreEngine(backup_base, target).max_workers == DEFAULT_RESTORE_WORKERS
+        assert RestoreEngine(backup_base, target, max_workers=2).max_workers == 2
+
+    def test_restore_many_files_with_bounded_pool(self, backup_structure: tuple) -> None:
+        """More files than the in-flight window are all restored."""
+        backup_base, target = backup_structure
+        backup_folder = backup_base / "Documents-Backup"
+        bulk = backup_folder / "bulk"
+        bulk.mkdir()
+        for i in range(50):
+            (bulk / f"item{i}.txt").write_text(f"item {i}")
+
+        engine = RestoreEngine(backup_path=backup_base, target_path=target, max_workers=2)
+
+        result = engine.restore()
+
+        assert result.errors == 0
+        assert result.restored_files == 53
+        assert len(result.file_actions) == 53
+        assert (target / "bulk" / "item49.txt").read_text() == "item 49"
+
+    def test_restore_hardlinks_when_enabled(self, backup_structure: tuple) -> None:
+        """Same-filesystem restores can hard-link instead of copying."""
+        backup_base, target = backup_structure
+        backup_file = backup_base / "Documents-Backup" / "file1.txt"
+
+        engine = RestoreEngine(
+            backup_path=backup_base, target_path=target, hardlink_when_possible=True
+        )
+        result = engine.restore()
+
+        assert result.errors == 0
+        assert result.restored_files == 3
+        assert (target / "file1.txt").read_text() == "Content 1"
+        assert os.path.samefile(target / "file1.txt", backup_file)
+
+    def test_restore_copies_by_default(self, backup_structure: tuple) -> None:
+        """Without the opt-in, restored files are independent copies."""
+        backup_base, target = backup_structure
+        backup_file = backup_base / "Documents-Backup" / "file1.txt"
+
+        RestoreEngine(backup_path=backup_base, target_path=target).restore()
+
+        assert not os.path.samefile(target / "file1.txt", backup_file)
+
+    def test_restore_hardlink_falls_back_to_copy(self, backup_structure: tuple) -> None:
+        """Cross-device link errors fall back to a regular copy."""
+        backup_base, target = backup_structure
+
+        engine = RestoreEngine(
+            backup_path=backup_base, target_path=target, hardlink_when_possible=True
+        )
+        with patch(
+            "smartbackup.core.restore.os.link",
+            side_effect=OSError(errno.EXDEV, "cross-device"),
+        ):
+            result = engine.restore()
+
+        assert result.errors == 0
+        assert result.restored_files == 3
+        assert (target / "file2.txt").read_text() == "Content 2"
+
+    @pytest.mark.parametrize("hardlink", [True, False])
+    def test_restore_replaces_stale_linked_temp(
+        self, backup_structure: tuple, hardlink: bool
+    ) -> None:
+        """A leftover .tmp hard-linked to the backup must not truncate the backup."""
+        backup_base, target = backup_structure
+        backup_file = backup_base / "Documents-Backup" / "file1.txt"
+        target.mkdir(parents=True, exist_ok=True)
+        os.link(backup_file, target / "file1.txt.tmp")
+
+        engine = RestoreEngine(
+            backup_path=backup_base, target_path=target, hardlink_when_possible=hardlink
+        )
+        result = engine.restore()
+
+        assert result.errors == 0
+        assert backup_file.read_text() == "Content 1"
+        assert (target / "file1.txt").read_text() == "Content 1"
+        assert not (target / "file1.txt.tmp").exists()
+
     def test_list_files(self, backup_structure: tuple) -> None:
         """Test listing files in backup."""
         backup_base, target = backup_structure
@@ -221,6 +358,53 @@ class TestRestoreEngine:
         # All 3 txt files match
         assert len(files) == 3
 
+    def test_list_files_with_multiple_patterns(self, backup_structure: tuple) -> None:
+        """A file matching any of several patterns is listed once."""
+        backup_base, target = backup_structure
+
+        engine = RestoreEngine(
+            backup_path=backup_base,
+            target_path=target,
+        )
+
+        files = engine.list_files(patterns=["file1*", "subdir/*", "*.txt", "nomatch?"])
+        assert sorted(str(f[0]) for f in files) == sorted(
+            ["file1.txt", "file2.txt", str(Path("subdir") / "file3.txt")]
+        )
+
+        files = engine.list_files(patterns=["file2*", "subdir/*"])
+        assert sorted(str(f[0]) for f in files) == sorted(
+            ["file2.txt", str(Path("subdir") / "file3.txt")]
+        )
+
+    def test_list_files_prunes_internal_entries(self, backup_structure: tuple) -> None:
+        """Internal top-level entries are skipped without being listed."""
+        backup_base, target = backup_structure
+        backup_folder = backup_base / "Documents-Backup"
+        (backup_folder / ".smartbackup_hashcache.sqlite").write_text("cache")
+        nested_logs = backup_folder / "subdir" / "_backup_logs"
+        nested_logs.mkdir()
+        (nested_logs / "notes.txt").write_text("user data")
+
+        engine = RestoreEngine(backup_path=backup_base, target_path=target)
+
+        with patch("smartbackup.core.restore.os.scandir", wraps=os.scandir) as scandir:
+            files = engine.list_files()
+
+        listed = {Path(call.args[0]).name for call in scandir.call_args_list}
+        assert "_backup_logs" in listed  # only the nested, user-owned one
+        assert str(backup_folder / "_backup_logs") not in {
+            call.args[0] for call in scandir.call_args_list
+        }
+        assert sorted(str(f[0]) for f in files) == sorted(
+            [
+                "file1.txt",
+                "file2.txt",
+                str(Path("subdir") / "file3.txt"),
+                str(Path("subdir") / "_backup_logs" / "notes.txt"),
+            ]
+        )
+
     def test_restore_nonexistent_backup(self, tmp_path: Path) -> None:
         """Test restore from nonexistent backup directory."""
         engine = RestoreEngine(
@@ -255,6 +439,28 @@ class TestRestoreEngine:
         assert info["source"] == "/original/source"
         assert info["backup_count"] == 5
 
+    def test_manifest_parsed_once_until_changed(self, backup_structure: tuple) -> None:
+        """Repeated lookups reuse the parsed manifest until the file changes."""
+        backup_base, target = backup_structure
+        backup_folder = backup_base / "Documents-Backup"
+        manager = JsonManifestManager(backup_folder)
+        from smartbackup.manifest.base import Manifest
+
+        manager.save(Manifest(source="/original/source", backup_count=5))
+
+        engine = RestoreEngine(backup_path=backup_base, target_path=target)
+
+        with patch.object(
+            engine._manifest_manager, "load", wraps=engine._manifest_manager.load
+        ) as load:
+            assert engine.get_manifest_info()["backup_count"] == 5
+            assert engine.get_manifest_info()["backup_count"] == 5
+            assert load.call_count == 1
+
+            manager.save(Manifest(source="/original/source", backup_count=12))
+            assert engine.get_manifest_info()["backup_count"] == 12
+            assert load.call_count == 2
+
     def test_get_manifest_info_no_manifest(self, backup_structure: tuple) -> None:
         """Test getting manifest info when no manifest exists."""
         backup_base, target = backup_structure
@@ -305,3 +511,8 @@ class TestConflictResolution:
         assert ConflictResolution.OVERWRITE.value == 2
         assert ConflictResolution.RENAME.value == 3
         assert ConflictResolution.NEWER.value == 4
+
+    def test_conflict_resolution_is_int(self) -> None:
+        """Resolutions are IntEnum members, usable as plain integers."""
+        assert ConflictResolution.OVERWRITE == 2
+        assert ConflictResolution(3) is ConflictResolution.RENAME
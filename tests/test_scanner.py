@@ -2,12 +2,15 @@
 Tests for the scanner module.
 """
 
+import hashlib
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from smartbackup.config import DEFAULT_EXCLUSIONS, EXCLUDED_EXTENSIONS
 from smartbackup.core.scanner import ExclusionFilter, FileScanner
+from smartbackup.parallel import STAT_PARALLEL_THRESHOLD
 from smartbackup.ui.logger import BackupLogger
 
 
@@ -37,6 +40,14 @@ class TestExclusionFilter:
         assert excluded is True
         assert "extension" in reason.lower()
 
+    def test_extension_exclusion_is_case_insensitive(self):
+        """Extensions match in any case; the reason keeps the name's spelling."""
+        filter = ExclusionFilter(set(), {".LOG"})
+
+        assert filter.match_name("Server.Log") == (True, "Excluded extension: .Log")
+        assert filter.match_name("server.log") == (True, "Excluded extension: .log")
+        assert filter.match_name(".log") == (False, "")
+
     def test_pattern_exclusion_wildcard(self):
         """Wildcard patterns should work."""
         filter = ExclusionFilter({"*.tmp", "*.log"}, set())
@@ -45,6 +56,28 @@ class TestExclusionFilter:
         assert excluded is True
         assert "Pattern match" in reason
 
+    def test_pattern_exclusion_reports_matching_pattern(self):
+        """The reason should name the pattern that matched."""
+        filter = ExclusionFilter({"*.tmp", "~*", "build?"}, set())
+
+        assert filter.match_name("~lockfile") == (True, "Pattern match: ^~.*$")
+        assert filter.match_name("BUILD1") == (True, "Pattern match: ^build.$")
+        assert filter.match_name("cache.TMP") == (True, r"Pattern match: ^.*\.tmp$")
+        assert filter.match_name("builds") == (True, "Pattern match: ^build.$")
+        assert filter.match_name("build") == (False, "")
+
+    def test_suffix_patterns_use_lookup(self):
+        """'*.ext' patterns should match like their regex without a regex call."""
+        filter = ExclusionFilter({"*.tmp", "*.egg-info"}, set())
+
+        assert set(filter.pattern_suffixes) == {".tmp"}
+        assert [p.pattern for p in filter.patterns] == [r"^.*\.egg-info$"]
+
+        for name in ("cache.tmp", "CACHE.TMP", ".tmp", "archive.tar.tmp"):
+            assert filter.match_name(name) == (True, r"Pattern match: ^.*\.tmp$")
+        for name in ("cache.tmpx", "tmp", "cache.tmp.txt"):
+            assert filter.match_name(name) == (False, "")
+
     def test_not_excluded_file(self):
         """Regular files should not be excluded."""
         filter = ExclusionFilter({"node_modules"}, {".pyc"})
@@ -76,6 +109,25 @@ class TestExclusionFilter:
         excluded, _ = filter.should_exclude(regular_dir)
         assert excluded is False
 
+    def test_venv_detection_from_listing(self, temp_dir: Path):
+        """A directory listing should stand in for the filesystem probes."""
+        filter = ExclusionFilter(set(), set())
+
+        venv_dir = temp_dir / "env_a"
+        (venv_dir / "bin").mkdir(parents=True)
+        (venv_dir / "bin" / "activate").write_text("")
+
+        assert filter.is_virtual_env(temp_dir / "anything", {"pyvenv.cfg", "lib"}) is True
+        assert filter.is_virtual_env(venv_dir, {"bin"}) is True
+        # Markers under names that are not listed are never probed
+        assert filter.is_virtual_env(venv_dir, {"src"}) is False
+        # Plain string paths work as well
+        assert filter.is_virtual_env(str(venv_dir)) is True
+        assert filter.is_virtual_env(str(temp_dir / "missing")) is False
+        excluded, reason = filter.should_exclude(venv_dir, {"bin"})
+        assert excluded is True
+        assert "Virtual environment" in reason
+
     def test_default_exclusions(self):
         """Default exclusions should exclude common dev artifacts."""
         filter = ExclusionFilter(DEFAULT_EXCLUSIONS, EXCLUDED_EXTENSIONS)
@@ -184,6 +236,18 @@ class TestFileScanner:
         assert file_info.file_hash is not None
         assert len(file_info.file_hash) == 64  # SHA-256 hex length
 
+    def test_scan_with_legacy_hash_algorithm(self, source_dir: Path):
+        """Scanner should hash with the configured algorithm."""
+        filter = ExclusionFilter(set(), set())
+        logger = BackupLogger(verbose=False)
+        scanner = FileScanner(filter, logger, use_hash=True, hash_algorithm="md5")
+
+        files = scanner.scan(source_dir)
+
+        file_info = files[Path("file1.txt")]
+        expected = hashlib.md5((source_dir / "file1.txt").read_bytes()).hexdigest()
+        assert file_info.file_hash == expected
+
     def test_scan_without_hash(self, source_dir: Path):
         """Scanner should not calculate hash when disabled."""
         filter = ExclusionFilter(set(), set())
@@ -206,3 +270,62 @@ class TestFileScanner:
         # Should have found some files and excluded some
         assert scanner._scan_count > 0
         assert scanner._excluded_count > 0
+
+    def test_parallel_scan_matches_serial(self, tmp_path: Path):
+        """Threaded stat/hash should produce the same result as the serial path."""
+        for d in range(10):
+            folder = tmp_path / f"dir{d}" / "nested"
+            folder.mkdir(parents=True)
+            for i in range(STAT_PARALLEL_THRESHOLD // 10 + 5):
+                (folder / f"file{i}.txt").write_text(f"content {d} {i}")
+
+        filter = ExclusionFilter(set(), set())
+        logger = BackupLogger(verbose=False)
+        serial = FileScanner(filter, logger, use_hash=True, max_workers=1).scan(tmp_path)
+        parallel = FileScanner(filter, logger, use_hash=True, max_workers=8).scan(tmp_path)
+
+        assert len(serial) > STAT_PARALLEL_THRESHOLD
+        assert list(parallel) == list(serial)
+        assert parallel == serial
+
+    def test_scan_workers_from_env(self, monkeypatch):
+        """SMARTBACKUP_STAT_THREADS should set the default scan worker count."""
+        filter = ExclusionFilter(set(), set())
+        logger = BackupLogger(verbose=False)
+        monkeypatch.setenv("SMARTBACKUP_STAT_THREADS", "6")
+
+        assert FileScanner(filter, logger).max_workers == 6
+        assert FileScanner(filter, logger, max_workers=2).max_workers == 2
+
+    def test_scan_skips_unnamed_venv(self, tmp_path: Path):
+        """Venvs are detected by structure, whatever they are called."""
+        (tmp_path / "project" / "tools" / "bin").mkdir(parents=True)
+        (tmp_path / "project" / "tools" / "pyvenv.cfg").write_text("home = /usr/bin")
+        (tmp_path / "project" / "tools" / "bin" / "python").write_text("")
+        (tmp_path / "project" / "main.py").write_text("print()")
+        (tmp_path / "pyvenv.cfg").write_text("not a venv root")
+
+        scanner = FileScanner(ExclusionFilter(set(), set()), BackupLogger(verbose=False))
+        files = scanner.scan(tmp_path)
+
+        assert set(files) == {Path("pyvenv.cfg"), Path("project/main.py")}
+        assert scanner._excluded_count == 1
+
+    def test_scan_matches_each_name_once(self, tmp_path: Path):
+        """Repeated names are matched against the rules once per scan."""
+        for package in ("a", "b", "c"):
+            (tmp_path / package).mkdir()
+            (tmp_path / package / "__init__.py").write_text("")
+            (tmp_path / package / "debug.log").write_text("")
+
+        filter = ExclusionFilter(set(), {".log"})
+        scanner = FileScanner(filter, BackupLogger(verbose=False))
+
+        with patch.object(filter, "match_name", wraps=filter.match_name) as match_name:
+            files = scanner.scan(tmp_path)
+
+        matched = [call.args[0] for call in match_name.call_args_list]
+        assert sorted(matched) == ["__init__.py", "a", "b", "c", "debug.log"]
+        assert len(files) == 3
+        assert scanner._excluded_count == 3
+        assert scanner._name_decisions == {}